@@ -187,6 +187,7 @@ async def get_chat_service() -> AsyncGenerator[ChatService, None]:
                 profile_repo=profile_repo,
                 conversation_repo=conversation_repo,
                 suggestion_repo=suggestion_repo,
+                session_factory=async_session_factory,
             )
 
             yield chat_service
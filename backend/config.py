@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_model: str = "gpt-4-turbo-preview"
     openai_timeout: int = 30
+    openai_max_concurrency: int = 16
+    openai_rpm: int = 500
 
     # CORS
     cors_origins: str = "http://localhost:3000"
@@ -43,6 +45,7 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     default_user_id: str = "default_user"
     max_conversation_history: int = 20
+    history_token_budget: int = 2000
 
     # API
     api_v1_prefix: str = "/api/v1"
@@ -18,8 +18,9 @@ Usage:
     target_metadata = Base.metadata
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Callable
 
+import orjson
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
@@ -28,7 +29,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction
 
 from backend.config import get_settings
 
@@ -45,6 +46,21 @@ class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
+def _json_serializer(value: Any) -> str:
+    """
+    Serialize JSON column values with orjson.
+
+    Non-string dict keys are stringified as json.dumps does; datetimes and
+    UUIDs in metadata are encoded natively.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Per-connection cache of prepared sqlite3 statements (stdlib default is 128);
+# sized so every repository statement shape stays prepared
+SQLITE_STATEMENT_CACHE_SIZE = 512
+
+
 def _create_engine(database_url: str) -> AsyncEngine:
     """
     Create and configure an async SQLAlchemy engine.
@@ -59,19 +75,24 @@ def _create_engine(database_url: str) -> AsyncEngine:
     Notes:
         - echo is disabled for production; enable via log level if needed.
         - pool_pre_ping ensures stale connections are detected.
-        - For SQLite, connect_args enables WAL mode and foreign key enforcement.
+        - For SQLite, connect_args enables WAL mode and foreign key enforcement,
+          and enlarges the prepared-statement cache.
+        - JSON columns are serialized and parsed with orjson.
     """
     connect_args = {}
 
     # SQLite-specific configuration
     if "sqlite" in database_url:
         connect_args["check_same_thread"] = False
+        connect_args["cached_statements"] = SQLITE_STATEMENT_CACHE_SIZE
 
     return create_async_engine(
         database_url,
         echo=False,
         future=True,
         connect_args=connect_args,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 
 
@@ -105,6 +126,43 @@ async_session_factory = async_sessionmaker(
 )
 
 
+# Session.info key holding callbacks to run once the transaction commits
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def call_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run a callback once the session's current transaction commits.
+
+    Callbacks run synchronously in registration order after the commit
+    succeeds and must not use the session. They are discarded, without
+    running, if the transaction is rolled back or the session closes first.
+
+    Args:
+        session: The session whose commit the callback waits for.
+        callback: Zero-argument callable to invoke after the commit.
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+def _run_after_commit_callbacks(session: Session) -> None:
+    """Invoke and clear the callbacks registered through call_after_commit."""
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        callback()
+
+
+def _discard_after_commit_callbacks(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    """Drop callbacks left over when the outermost transaction ends uncommitted."""
+    if transaction.parent is None:
+        session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+event.listen(Session, "after_commit", _run_after_commit_callbacks)
+event.listen(Session, "after_transaction_end", _discard_after_commit_callbacks)
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Yield an async database session for dependency injection.
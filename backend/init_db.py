@@ -0,0 +1,34 @@
+"""
+Standalone database initialization for OthelloMini.
+
+Creates all tables registered on Base.metadata without starting the API
+server, for CI and container init steps. Runs on uvloop when it is
+installed and falls back to the stock asyncio loop otherwise.
+
+Usage:
+    python -m backend.init_db
+"""
+
+import asyncio
+
+import backend.models  # noqa: F401  (registers all models on Base.metadata)
+from backend.database import dispose_engine, init_db
+
+try:
+    import uvloop
+
+    _runner = uvloop.run
+except ImportError:
+    _runner = asyncio.run
+
+
+async def main() -> None:
+    """Create all tables, then release engine connections."""
+    try:
+        await init_db()
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    _runner(main())
@@ -13,9 +13,14 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from backend.config import settings
-from backend.database import engine, async_session_factory, Base
+from backend.database import async_session_factory, engine, Base
+from backend.models.user_profile import UserProfile
+from backend.services.ai_service import close_ai_clients
+from backend.services.chat_service import drain_background_tasks
 from backend.api.chat import router as chat_router
 from backend.api.profile import router as profile_router
 from backend.api.suggestions import router as suggestions_router
@@ -28,45 +33,49 @@ from backend.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-async def _seed_default_user() -> None:
-    """Seed the default user profile if it does not exist."""
-    from backend.repositories.profile_repository import ProfileRepository
-
-    async with async_session_factory() as session:
-        repo = ProfileRepository(session)
-        existing = await repo.get_by_user_id(settings.DEFAULT_USER_ID)
-        if existing is None:
-            logger.info(
-                "Seeding default user profile",
-                extra={"user_id": settings.DEFAULT_USER_ID},
-            )
-            await repo.create(
-                user_id=settings.DEFAULT_USER_ID,
-                display_name="User",
-                consent_tier="Suggestive",
-                traits={
-                    "openness": 0.7,
-                    "conscientiousness": 0.6,
-                    "extraversion": 0.5,
-                    "agreeableness": 0.65,
-                    "neuroticism": 0.45,
-                    "risk_tolerance": "medium",
-                    "decision_style": "analytical",
-                },
-                preferences={
-                    "communication_style": "conversational",
-                    "focus_areas": ["productivity", "wellness"],
-                    "notification_frequency": "daily",
-                },
-                context_summary="New user exploring AI life companion features.",
-            )
-            await session.commit()
-            logger.info("Default user profile seeded successfully")
-        else:
-            logger.info(
-                "Default user profile already exists",
-                extra={"user_id": settings.DEFAULT_USER_ID},
-            )
+async def _seed_default_user(conn: AsyncConnection) -> None:
+    """
+    Seed the default user profile if it does not exist.
+
+    Issued as a single INSERT ... ON CONFLICT (user_id) DO NOTHING on the
+    connection that created the tables, so startup needs neither a separate
+    session nor an existence SELECT.
+    """
+    result = await conn.execute(
+        sqlite_insert(UserProfile)
+        .values(
+            user_id=settings.DEFAULT_USER_ID,
+            display_name="User",
+            consent_tier="Suggestive",
+            traits={
+                "openness": 0.7,
+                "conscientiousness": 0.6,
+                "extraversion": 0.5,
+                "agreeableness": 0.65,
+                "neuroticism": 0.45,
+                "risk_tolerance": "medium",
+                "decision_style": "analytical",
+            },
+            preferences={
+                "communication_style": "conversational",
+                "focus_areas": ["productivity", "wellness"],
+                "notification_frequency": "daily",
+            },
+            behavioral_patterns={},
+            context_summary="New user exploring AI life companion features.",
+        )
+        .on_conflict_do_nothing(index_elements=["user_id"])
+    )
+    if result.rowcount:
+        logger.info(
+            "Default user profile seeded successfully",
+            extra={"user_id": settings.DEFAULT_USER_ID},
+        )
+    else:
+        logger.info(
+            "Default user profile already exists",
+            extra={"user_id": settings.DEFAULT_USER_ID},
+        )
 
 
 @asynccontextmanager
@@ -75,17 +84,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Application lifespan manager.
 
     On startup: creates database tables (if not exist) and seeds default user.
-    On shutdown: disposes database engine connections.
+    On shutdown: drains background chat tasks, closes AI clients, and
+    disposes database engine connections.
     """
     logger.info("OthelloMini API starting up...")
 
     # Create all tables if they don't exist (fallback for non-Alembic environments)
+    # and seed the default user profile in the same transaction
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables verified/created")
-
-    # Seed default user profile
-    await _seed_default_user()
+        logger.info("Database tables verified/created")
+        await _seed_default_user(conn)
 
     logger.info(
         "OthelloMini API ready",
@@ -100,6 +109,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("OthelloMini API shutting down...")
+    await drain_background_tasks(async_session_factory)
+    await close_ai_clients()
     await engine.dispose()
     logger.info("Database connections closed")
 
@@ -188,3 +199,11 @@ def create_app() -> FastAPI:
 
 # Application instance used by uvicorn
 app = create_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvicorn's default loop="auto" already selects uvloop when installed;
+    # bind to uvicorn's loopback default, use its CLI for other addresses
+    uvicorn.run(app)
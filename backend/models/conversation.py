@@ -81,6 +81,12 @@ class Conversation(Base):
             name="role_check",
         ),
         Index("idx_conversations_created_at", created_at.desc()),
+        # Serves the recent-history lookup: filter by profile, newest first
+        Index(
+            "idx_conversations_profile_created_at",
+            "user_profile_id",
+            created_at.desc(),
+        ),
         Index("idx_conversations_role", "role"),
     )
 
@@ -6,14 +6,46 @@ conversation history by user profile, and retrieving individual messages.
 All ORM/SQL logic is encapsulated within this repository layer.
 """
 
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from functools import partial
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.database import call_after_commit
 from backend.models.conversation import Conversation
 from backend.repositories.base import BaseRepository
 
+# Number of recent user/assistant messages mirrored in memory per profile
+RECENT_HISTORY_SIZE = 20
+
+# Mirrored history is reloaded from the database after this long, bounding
+# how stale it can get when other workers serve turns for the same profile
+RECENT_HISTORY_TTL_SECONDS = 30.0
+
+# user_profile_id -> (monotonic expiry, most recent role/content dicts, oldest
+# first). The database stays the source of truth; a profile missing here, or
+# whose entry has expired, is loaded from it.
+_RECENT_HISTORY: Dict[int, Tuple[float, Deque[Dict[str, str]]]] = {}
+
+
+def forget_recent_history(session: AsyncSession, user_profile_id: int) -> None:
+    """
+    Evict a profile's mirrored history now and again once the session commits.
+
+    Called on every path that deletes conversation rows. The second eviction
+    drops anything a concurrent read re-mirrored from the database before
+    the delete committed.
+
+    Args:
+        session: The session performing the delete.
+        user_profile_id: The ID of the user profile whose history to evict.
+    """
+    _RECENT_HISTORY.pop(user_profile_id, None)
+    call_after_commit(session, partial(_RECENT_HISTORY.pop, user_profile_id, None))
+
 
 class ConversationRepository(BaseRepository[Conversation]):
     """
@@ -56,13 +88,53 @@ class ConversationRepository(BaseRepository[Conversation]):
         Returns:
             The newly created Conversation instance.
         """
-        data: Dict[str, Any] = {
-            "user_profile_id": user_profile_id,
-            "role": role,
-            "content": content,
-            "metadata": metadata if metadata is not None else {},
-        }
-        return await self.create(data)
+        # Every column is client-generated, so the flush populates the id and
+        # no refresh SELECT is needed afterwards
+        instance = self.add_message(user_profile_id, role, content, metadata)
+        await self.session.flush()
+        return instance
+
+    def add_message(
+        self,
+        user_profile_id: int,
+        role: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Conversation:
+        """
+        Add a conversation message to the session without flushing it.
+
+        The row is inserted with the session's next flush or commit, together
+        with any dependent rows (e.g. suggestions linked through the
+        ``conversation`` relationship), in one unit of work.
+
+        Args:
+            user_profile_id: The ID of the user profile this message belongs to.
+            role: The message role - one of 'user', 'assistant', or 'system'.
+            content: The text content of the message.
+            metadata: Optional JSON metadata (e.g., mood, context, timestamps).
+
+        Returns:
+            The pending Conversation instance.
+        """
+        instance = self._build_message(user_profile_id, role, content, metadata)
+        self.session.add(instance)
+        return instance
+
+    @staticmethod
+    def _build_message(
+        user_profile_id: int,
+        role: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> Conversation:
+        """Construct a Conversation instance from message fields."""
+        return Conversation(
+            user_profile_id=user_profile_id,
+            role=role,
+            content=content,
+            metadata_=metadata if metadata is not None else {},
+        )
 
     async def get_by_user_profile_id(
         self,
@@ -126,6 +198,76 @@ class ConversationRepository(BaseRepository[Conversation]):
         )
         return list(result.scalars().all())
 
+    async def get_recent_history(
+        self,
+        user_profile_id: int,
+        limit: int = RECENT_HISTORY_SIZE,
+    ) -> List[Dict[str, str]]:
+        """
+        Retrieve recent user/assistant messages as role/content dicts.
+
+        Served from the in-memory mirror when the profile is present there
+        and its entry is younger than RECENT_HISTORY_TTL_SECONDS; otherwise
+        loaded from the database and mirrored for later turns.
+
+        Args:
+            user_profile_id: The ID of the user profile to filter by.
+            limit: Maximum number of recent messages to return (default 20).
+
+        Returns:
+            List of {"role", "content"} dicts, chronologically ordered.
+        """
+        mirrored = _RECENT_HISTORY.get(user_profile_id)
+        if (
+            mirrored is not None
+            and limit <= RECENT_HISTORY_SIZE
+            and mirrored[0] > time.monotonic()
+        ):
+            history = list(mirrored[1])
+            return history[-limit:] if limit < len(history) else history
+
+        # Column projection filtered in SQL: no ORM instances are hydrated
+        result = await self.session.execute(
+            select(Conversation.role, Conversation.content)
+            .where(
+                Conversation.user_profile_id == user_profile_id,
+                Conversation.role.in_(("user", "assistant")),
+            )
+            .order_by(Conversation.created_at.desc())
+            .limit(max(limit, RECENT_HISTORY_SIZE))
+        )
+        history = [
+            {"role": role, "content": content}
+            for role, content in reversed(result.all())
+        ]
+        _RECENT_HISTORY[user_profile_id] = (
+            time.monotonic() + RECENT_HISTORY_TTL_SECONDS,
+            deque(history, maxlen=RECENT_HISTORY_SIZE),
+        )
+        return history[-limit:] if limit < len(history) else history
+
+    def record_history(
+        self, user_profile_id: int, messages: List[Dict[str, str]]
+    ) -> None:
+        """
+        Mirror role/content messages into the in-memory history once committed.
+
+        The append waits for this repository's session to commit, so messages
+        from a rolled-back turn never reach the mirror. Profiles not mirrored
+        by then are skipped; their next read loads from the database.
+
+        Args:
+            user_profile_id: The ID of the user profile the messages belong to.
+            messages: Role/content dicts, oldest first.
+        """
+
+        def append() -> None:
+            mirrored = _RECENT_HISTORY.get(user_profile_id)
+            if mirrored is not None:
+                mirrored[1].extend(messages)
+
+        call_after_commit(self.session, append)
+
     async def get_by_role(
         self,
         user_profile_id: int,
@@ -194,4 +336,32 @@ class ConversationRepository(BaseRepository[Conversation]):
             )
         )
         await self.session.flush()
+        forget_recent_history(self.session, user_profile_id)
         return result.rowcount
+
+    async def delete_by_id(self, record_id: int) -> bool:
+        """
+        Delete a conversation message by its primary key ID.
+
+        The owning profile's mirrored history is evicted, so the deleted
+        message stops feeding prompts.
+
+        Args:
+            record_id: The integer primary key of the message to delete.
+
+        Returns:
+            True if a message was deleted, False if none was found.
+        """
+        from sqlalchemy import delete as sql_delete
+
+        result = await self.session.execute(
+            sql_delete(Conversation)
+            .where(Conversation.id == record_id)
+            .returning(Conversation.user_profile_id)
+        )
+        user_profile_id = result.scalar_one_or_none()
+        await self.session.flush()
+        if user_profile_id is None:
+            return False
+        forget_recent_history(self.session, user_profile_id)
+        return True
@@ -10,14 +10,119 @@ Services interact exclusively through this interface — no direct database
 access from upper layers.
 """
 
+import asyncio
+import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select, update
+import orjson
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.database import call_after_commit
 from backend.models.user_profile import UserProfile
 from backend.repositories.base import BaseRepository
+from backend.repositories.conversation_repository import forget_recent_history
+
+# How long a profile read through get_or_create_default_cached is reused
+PROFILE_CACHE_TTL_SECONDS = 5.0
+
+# user_id -> (monotonic expiry time, profile). Instances are detached once
+# their session closes; expire_on_commit=False keeps their loaded attributes.
+_PROFILE_CACHE: Dict[str, Tuple[float, UserProfile]] = {}
+
+# user_id -> lock serializing cache misses, so concurrent first reads issue
+# one SELECT (and at most one default INSERT) between them. An entry lives
+# only while its miss is being filled.
+_PROFILE_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# Profile primary key -> interaction records buffered for a later
+# append_interactions, oldest first. Deleting the profile drops its entry.
+_PENDING_INTERACTIONS: Dict[int, List[Dict[str, Any]]] = {}
+
+# JSON columns that updates shallow-merge into instead of replacing
+MERGE_FIELDS = ("traits", "preferences", "behavioral_patterns")
+
+# Field values for profiles created on first access
+DEFAULT_PROFILE_DATA: Dict[str, Any] = {
+    "display_name": "User",
+    "consent_tier": "Suggestive",
+    "context_summary": None,
+    "profile_version": 1,
+}
+
+# Key/value pairs per json_set call, well under SQLite's function-argument cap
+_JSON_SET_PAIRS = 50
+
+
+def buffer_interaction(record_id: int, interaction: Dict[str, Any]) -> int:
+    """
+    Queue an interaction record for a profile's next append_interactions.
+
+    Args:
+        record_id: The integer primary key of the profile.
+        interaction: The interaction record to queue.
+
+    Returns:
+        Number of interactions now pending for the profile.
+    """
+    pending = _PENDING_INTERACTIONS.setdefault(record_id, [])
+    pending.append(interaction)
+    return len(pending)
+
+
+def take_pending_interactions(record_id: int) -> Optional[List[Dict[str, Any]]]:
+    """Remove and return a profile's pending interactions, or None if there are none."""
+    return _PENDING_INTERACTIONS.pop(record_id, None)
+
+
+def pending_interaction_ids() -> List[int]:
+    """Return the primary keys of profiles with pending interactions."""
+    return list(_PENDING_INTERACTIONS)
+
+
+def _evict_cached_id(record_id: int) -> None:
+    """Drop the cached profile with the given primary key, if any."""
+    for user_id, (_, profile) in list(_PROFILE_CACHE.items()):
+        if profile.id == record_id:
+            del _PROFILE_CACHE[user_id]
+
+
+def _json_merge(column: Any, patch: Dict[str, Any]) -> Any:
+    """
+    Build a SQL expression that shallow-merges patch into a JSON column.
+
+    Each top-level key is written with json_set, so the merge runs inside
+    SQLite and the stored document is never read back into Python. New
+    keys override existing ones, matching {**current, **patch}.
+
+    Args:
+        column: The JSON column (or expression) holding the current value.
+        patch: Top-level keys and values to merge in.
+
+    Returns:
+        The merge expression, or None when a key cannot be addressed by a
+        SQLite JSON path (it contains a double quote).
+    """
+    keys = [str(key) for key in patch]
+    if any('"' in key for key in keys):
+        return None
+
+    expr = func.coalesce(column, func.json_object())
+    pairs = [
+        (
+            f'$."{key}"',
+            func.json(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()),
+        )
+        for key, value in zip(keys, patch.values())
+    ]
+    for start in range(0, len(pairs), _JSON_SET_PAIRS):
+        args = [arg for pair in pairs[start:start + _JSON_SET_PAIRS] for arg in pair]
+        expr = func.json_set(expr, *args)
+    return expr
 
 
 class ProfileRepository(BaseRepository[UserProfile]):
@@ -44,6 +149,45 @@ class ProfileRepository(BaseRepository[UserProfile]):
         """
         super().__init__(session)
 
+    async def update_by_id(
+        self, record_id: int, data: Dict[str, Any]
+    ) -> Optional[UserProfile]:
+        """
+        Update a profile by primary key, evicting its cached copy.
+
+        Args:
+            record_id: The integer primary key of the profile to update.
+            data: Dictionary mapping column names to updated values.
+
+        Returns:
+            The updated UserProfile instance if found, None otherwise.
+        """
+        _evict_cached_id(record_id)
+        return await super().update_by_id(record_id, data)
+
+    async def delete_by_id(self, record_id: int) -> bool:
+        """
+        Delete a profile by primary key, evicting its in-memory state.
+
+        Besides the cached profile, this drops buffered interactions and the
+        mirrored conversation history (whose rows go by cascade), both now
+        and once the delete commits. SQLite may reuse the id, so a later
+        profile must not inherit either.
+
+        Args:
+            record_id: The integer primary key of the profile to delete.
+
+        Returns:
+            True if a profile was deleted, False if none was found.
+        """
+        _evict_cached_id(record_id)
+        _PENDING_INTERACTIONS.pop(record_id, None)
+        call_after_commit(
+            self.session, partial(_PENDING_INTERACTIONS.pop, record_id, None)
+        )
+        forget_recent_history(self.session, record_id)
+        return await super().delete_by_id(record_id)
+
     async def get_by_user_id(self, user_id: str) -> Optional[UserProfile]:
         """
         Retrieve a user profile by its unique user_id string.
@@ -79,30 +223,88 @@ class ProfileRepository(BaseRepository[UserProfile]):
         Returns:
             The created or updated UserProfile instance.
         """
-        existing = await self.get_by_user_id(user_id)
+        _PROFILE_CACHE.pop(user_id, None)
+
+        # New rows take data as-is; existing rows also get their version
+        # incremented for auditability. The row comes back via RETURNING.
+        stmt = sqlite_insert(self.model).values(user_id=user_id, **data)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                **data,
+                "profile_version": self.model.profile_version + 1,
+                "updated_at": datetime.now(timezone.utc),
+            },
+        ).returning(self.model)
 
-        if existing is not None:
-            # Increment profile version for auditability
-            update_data = {**data}
-            update_data["profile_version"] = existing.profile_version + 1
-            update_data["updated_at"] = datetime.now(timezone.utc)
-
-            await self.session.execute(
-                update(self.model)
-                .where(self.model.id == existing.id)
-                .values(**update_data)
-            )
-            await self.session.flush()
-            await self.session.refresh(existing)
-            return existing
-        else:
-            # Create new profile
-            create_data = {"user_id": user_id, **data}
-            return await self.create(create_data)
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalars().one()
+
+    async def apply_updates(self, user_id: str, data: Dict[str, Any]) -> UserProfile:
+        """
+        Apply several profile field changes as a single versioned write.
+
+        Fields in MERGE_FIELDS are shallow-merged into the stored JSON (new
+        keys override); all other fields are set directly. The profile is
+        created if missing, profile_version is bumped once for the whole
+        batch, and everything runs as one upsert returning the row.
+
+        Args:
+            user_id: The unique string identifier for the user.
+            data: Dictionary of field values. May include: display_name,
+                  consent_tier, traits, preferences, behavioral_patterns,
+                  context_summary.
+
+        Returns:
+            The updated UserProfile instance.
+        """
+        if not data:
+            return await self.get_or_create_default(user_id)
+
+        merges = {field: data[field] for field in MERGE_FIELDS if field in data}
+        values = {field: value for field, value in data.items() if field not in merges}
+        return await self._upsert_fields(user_id, merges=merges, **values)
+
+    async def _merge_in_python(
+        self,
+        user_id: str,
+        values: Dict[str, Any],
+        merges: Dict[str, Dict[str, Any]],
+    ) -> UserProfile:
+        """
+        Read-merge-write fallback for patches SQLite JSON paths cannot express.
+
+        Args:
+            user_id: The unique string identifier for the user.
+            values: Column values to set directly.
+            merges: JSON column name -> keys to shallow-merge into it.
+
+        Returns:
+            The updated UserProfile instance.
+        """
+        existing = await self.get_or_create_default(user_id)
+        _PROFILE_CACHE.pop(user_id, None)
+
+        values = {**values}
+        for field, patch in merges.items():
+            values[field] = (getattr(existing, field) or {}) | patch
+        values["profile_version"] = existing.profile_version + 1
+        values["updated_at"] = datetime.now(timezone.utc)
+
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == existing.id)
+            .values(**values)
+            .returning(self.model),
+            execution_options={"populate_existing": True},
+        )
+        return result.scalars().one()
 
     async def update_consent_tier(
         self, user_id: str, consent_tier: str
-    ) -> Optional[UserProfile]:
+    ) -> UserProfile:
         """
         Update the consent tier for a user profile.
 
@@ -115,8 +317,8 @@ class ProfileRepository(BaseRepository[UserProfile]):
                           'Passive', 'Suggestive', 'Active', 'Autonomous'.
 
         Returns:
-            The updated UserProfile instance if found, None if no profile
-            exists for the given user_id.
+            The updated UserProfile instance. A default profile is created
+            first if none exists for the given user_id.
 
         Raises:
             ValueError: If consent_tier is not a valid tier value.
@@ -128,26 +330,11 @@ class ProfileRepository(BaseRepository[UserProfile]):
                 f"Must be one of: {', '.join(sorted(valid_tiers))}"
             )
 
-        existing = await self.get_by_user_id(user_id)
-        if existing is None:
-            return None
-
-        await self.session.execute(
-            update(self.model)
-            .where(self.model.id == existing.id)
-            .values(
-                consent_tier=consent_tier,
-                profile_version=existing.profile_version + 1,
-                updated_at=datetime.now(timezone.utc),
-            )
-        )
-        await self.session.flush()
-        await self.session.refresh(existing)
-        return existing
+        return await self._upsert_fields(user_id, consent_tier=consent_tier)
 
     async def update_traits(
         self, user_id: str, traits: Dict[str, Any]
-    ) -> Optional[UserProfile]:
+    ) -> UserProfile:
         """
         Update the psychological traits for a user profile.
 
@@ -161,33 +348,14 @@ class ProfileRepository(BaseRepository[UserProfile]):
                     {"openness": 0.8, "conscientiousness": 0.7}
 
         Returns:
-            The updated UserProfile instance if found, None if no profile
-            exists for the given user_id.
+            The updated UserProfile instance. A default profile is created
+            first if none exists for the given user_id.
         """
-        existing = await self.get_by_user_id(user_id)
-        if existing is None:
-            return None
-
-        # Merge existing traits with new traits (new values override)
-        current_traits = existing.traits or {}
-        merged_traits = {**current_traits, **traits}
-
-        await self.session.execute(
-            update(self.model)
-            .where(self.model.id == existing.id)
-            .values(
-                traits=merged_traits,
-                profile_version=existing.profile_version + 1,
-                updated_at=datetime.now(timezone.utc),
-            )
-        )
-        await self.session.flush()
-        await self.session.refresh(existing)
-        return existing
+        return await self._upsert_fields(user_id, merges={"traits": traits})
 
     async def update_preferences(
         self, user_id: str, preferences: Dict[str, Any]
-    ) -> Optional[UserProfile]:
+    ) -> UserProfile:
         """
         Update the user preferences for a user profile.
 
@@ -201,32 +369,14 @@ class ProfileRepository(BaseRepository[UserProfile]):
                                    "priority_areas": ["health"]}
 
         Returns:
-            The updated UserProfile instance if found, None if no profile
-            exists for the given user_id.
+            The updated UserProfile instance. A default profile is created
+            first if none exists for the given user_id.
         """
-        existing = await self.get_by_user_id(user_id)
-        if existing is None:
-            return None
-
-        current_preferences = existing.preferences or {}
-        merged_preferences = {**current_preferences, **preferences}
-
-        await self.session.execute(
-            update(self.model)
-            .where(self.model.id == existing.id)
-            .values(
-                preferences=merged_preferences,
-                profile_version=existing.profile_version + 1,
-                updated_at=datetime.now(timezone.utc),
-            )
-        )
-        await self.session.flush()
-        await self.session.refresh(existing)
-        return existing
+        return await self._upsert_fields(user_id, merges={"preferences": preferences})
 
     async def update_behavioral_patterns(
         self, user_id: str, behavioral_patterns: Dict[str, Any]
-    ) -> Optional[UserProfile]:
+    ) -> UserProfile:
         """
         Update the behavioral patterns for a user profile.
 
@@ -240,32 +390,69 @@ class ProfileRepository(BaseRepository[UserProfile]):
                                            "work_hours": "9-17"}
 
         Returns:
-            The updated UserProfile instance if found, None if no profile
-            exists for the given user_id.
+            The updated UserProfile instance. A default profile is created
+            first if none exists for the given user_id.
         """
-        existing = await self.get_by_user_id(user_id)
-        if existing is None:
-            return None
+        return await self._upsert_fields(
+            user_id, merges={"behavioral_patterns": behavioral_patterns}
+        )
+
+    async def append_interactions(
+        self,
+        record_id: int,
+        interactions: List[Dict[str, Any]],
+        max_tracked: int,
+    ) -> bool:
+        """
+        Append records to the interaction log in a profile's behavioral patterns.
+
+        Only behavioral_patterns["interactions"] is rewritten, through
+        json_set, so pattern keys merged in by other writers are never
+        overwritten. The log keeps its newest max_tracked entries.
+        profile_version is left unchanged: the log is bookkeeping, not a
+        profile edit.
 
-        current_patterns = existing.behavioral_patterns or {}
-        merged_patterns = {**current_patterns, **behavioral_patterns}
+        Args:
+            record_id: The integer primary key of the profile.
+            interactions: Interaction records to append, oldest first.
+            max_tracked: Maximum number of entries the log keeps.
 
+        Returns:
+            True if the profile exists and was updated, False otherwise.
+        """
+        result = await self.session.execute(
+            select(
+                self.model.user_id,
+                func.json_extract(self.model.behavioral_patterns, "$.interactions"),
+            ).where(self.model.id == record_id)
+        )
+        row = result.first()
+        if row is None:
+            return False
+        user_id, stored_json = row
+        _PROFILE_CACHE.pop(user_id, None)
+
+        stored = orjson.loads(stored_json) if stored_json else []
+        # Bounded ring buffer: the oldest interactions drop off on extend
+        log = deque(
+            stored if isinstance(stored, list) else (),
+            maxlen=max_tracked,
+        )
+        log.extend(interactions)
         await self.session.execute(
             update(self.model)
-            .where(self.model.id == existing.id)
+            .where(self.model.id == record_id)
             .values(
-                behavioral_patterns=merged_patterns,
-                profile_version=existing.profile_version + 1,
-                updated_at=datetime.now(timezone.utc),
+                behavioral_patterns=_json_merge(
+                    self.model.behavioral_patterns, {"interactions": list(log)}
+                )
             )
         )
-        await self.session.flush()
-        await self.session.refresh(existing)
-        return existing
+        return True
 
     async def update_context_summary(
         self, user_id: str, context_summary: str
-    ) -> Optional[UserProfile]:
+    ) -> UserProfile:
         """
         Update the context summary narrative for a user profile.
 
@@ -277,25 +464,60 @@ class ProfileRepository(BaseRepository[UserProfile]):
             context_summary: Narrative text summarizing current user context.
 
         Returns:
-            The updated UserProfile instance if found, None if no profile
-            exists for the given user_id.
+            The updated UserProfile instance. A default profile is created
+            first if none exists for the given user_id.
         """
-        existing = await self.get_by_user_id(user_id)
-        if existing is None:
-            return None
+        return await self._upsert_fields(user_id, context_summary=context_summary)
 
-        await self.session.execute(
-            update(self.model)
-            .where(self.model.id == existing.id)
-            .values(
-                context_summary=context_summary,
-                profile_version=existing.profile_version + 1,
-                updated_at=datetime.now(timezone.utc),
-            )
+    async def _upsert_fields(
+        self,
+        user_id: str,
+        merges: Optional[Dict[str, Dict[str, Any]]] = None,
+        **values: Any,
+    ) -> UserProfile:
+        """
+        Set columns on a profile in a single INSERT ... ON CONFLICT DO UPDATE.
+
+        A missing profile is created from DEFAULT_PROFILE_DATA with the values
+        applied; an existing one gets the values, a bumped profile_version and
+        a fresh updated_at. The row comes back via RETURNING, so no SELECT is
+        issued before or after the write.
+
+        Args:
+            user_id: The unique string identifier for the user.
+            merges: JSON column name -> keys to shallow-merge into it
+                    server-side. A new profile takes the patch as-is.
+            **values: Column values to set.
+
+        Returns:
+            The created or updated UserProfile instance.
+        """
+        merges = merges or {}
+        set_values = {**values}
+        for field, patch in merges.items():
+            merged = _json_merge(getattr(self.model, field), patch)
+            if merged is None:
+                return await self._merge_in_python(user_id, values, merges)
+            set_values[field] = merged
+
+        _PROFILE_CACHE.pop(user_id, None)
+
+        stmt = sqlite_insert(self.model).values(
+            user_id=user_id, **{**DEFAULT_PROFILE_DATA, **values, **merges}
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                **set_values,
+                "profile_version": self.model.profile_version + 1,
+                "updated_at": datetime.now(timezone.utc),
+            },
+        ).returning(self.model)
+
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
         )
-        await self.session.flush()
-        await self.session.refresh(existing)
-        return existing
+        return result.scalars().one()
 
     async def get_or_create_default(
         self, user_id: str, defaults: Optional[Dict[str, Any]] = None
@@ -326,16 +548,56 @@ class ProfileRepository(BaseRepository[UserProfile]):
 
         default_data: Dict[str, Any] = {
             "user_id": user_id,
-            "display_name": "User",
-            "consent_tier": "Suggestive",
+            **DEFAULT_PROFILE_DATA,
             "traits": {},
             "preferences": {},
             "behavioral_patterns": {},
-            "context_summary": None,
-            "profile_version": 1,
         }
 
         if defaults:
             default_data.update(defaults)
 
         return await self.create(default_data)
+
+    async def get_or_create_default_cached(self, user_id: str) -> UserProfile:
+        """
+        Retrieve a profile via get_or_create_default, reusing recent reads.
+
+        Profiles are cached in-process for PROFILE_CACHE_TTL_SECONDS so rapid
+        successive chat turns skip the SELECT. Profile updates and deletes
+        made through this repository evict the user's entry; writes from
+        other processes or raw SQL are only picked up once it expires.
+        Concurrent misses for the same user wait on a lock and share the
+        first load. The cached instance is shared between requests and
+        must be treated as read-only.
+
+        Args:
+            user_id: The unique string identifier for the user.
+
+        Returns:
+            The cached or freshly loaded UserProfile instance.
+        """
+        cached = _PROFILE_CACHE.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        lock = _PROFILE_LOCKS.get(user_id)
+        if lock is None:
+            lock = _PROFILE_LOCKS[user_id] = asyncio.Lock()
+
+        async with lock:
+            # Another request may have filled the cache while we waited
+            cached = _PROFILE_CACHE.get(user_id)
+            now = time.monotonic()
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+            try:
+                profile = await self.get_or_create_default(user_id)
+            finally:
+                # Waiters already hold the lock object; later callers either
+                # hit the cache or start a fresh lock
+                if _PROFILE_LOCKS.get(user_id) is lock:
+                    del _PROFILE_LOCKS[user_id]
+            _PROFILE_CACHE[user_id] = (now + PROFILE_CACHE_TTL_SECONDS, profile)
+            return profile
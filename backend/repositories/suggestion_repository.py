@@ -62,6 +62,32 @@ class SuggestionRepository(BaseRepository[Suggestion]):
             data["status"] = "pending"
         return await self.create(data)
 
+    async def create_suggestions_bulk(
+        self, rows: List[dict[str, Any]]
+    ) -> List[Suggestion]:
+        """
+        Create several suggestion records with a single flush.
+
+        All rows are added to the session and flushed together, so the
+        inserts are sent as one batched statement instead of one round-trip
+        per suggestion.
+
+        Args:
+            rows: Suggestion field dictionaries, same keys as create_suggestion.
+
+        Returns:
+            The created Suggestion instances in input order, with ids populated.
+        """
+        if not rows:
+            return []
+
+        instances = [
+            self.model(**{"status": "pending", **row}) for row in rows
+        ]
+        self.session.add_all(instances)
+        await self.session.flush()
+        return instances
+
     async def get_by_user_profile_id(
         self,
         user_profile_id: int,
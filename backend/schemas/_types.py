@@ -0,0 +1,26 @@
+"""Shared annotated field types reused across OthelloMini schemas."""
+
+from typing import Annotated, Optional
+
+from pydantic import AfterValidator, Field
+
+# Normalized score on a 0.0-1.0 scale (trait scores, confidence values)
+Score01 = Annotated[float, Field(ge=0.0, le=1.0)]
+
+# Maximum length of free-text user feedback on suggestions
+MAX_FEEDBACK_LENGTH = 500
+
+
+def _check_feedback_length(value: Optional[str]) -> Optional[str]:
+    """Reject feedback longer than MAX_FEEDBACK_LENGTH with a plain len() check."""
+    if value is not None and len(value) > MAX_FEEDBACK_LENGTH:
+        raise ValueError(f"must be at most {MAX_FEEDBACK_LENGTH} characters")
+    return value
+
+
+# Optional free-text feedback, length-checked without the constrained-str validator
+FeedbackText = Annotated[
+    Optional[str],
+    AfterValidator(_check_feedback_length),
+    Field(json_schema_extra={"maxLength": MAX_FEEDBACK_LENGTH}),
+]
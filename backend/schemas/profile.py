@@ -6,10 +6,12 @@ consent tier validation, traits representation, preferences, and context summary
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from backend.schemas._types import Score01
+
 
 class ConsentTier(str, Enum):
     """Consent tier levels determining suggestion visibility.
@@ -73,34 +75,26 @@ class TraitsSchema(BaseModel):
     and 1.0 = high trait expression.
     """
 
-    openness: Optional[float] = Field(
+    __slots__ = ()
+
+    openness: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Openness to new experiences (Big Five trait)",
     )
-    conscientiousness: Optional[float] = Field(
+    conscientiousness: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Conscientiousness trait score",
     )
-    extraversion: Optional[float] = Field(
+    extraversion: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Extraversion trait score",
     )
-    agreeableness: Optional[float] = Field(
+    agreeableness: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Agreeableness trait score",
     )
-    neuroticism: Optional[float] = Field(
+    neuroticism: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Neuroticism trait score",
     )
     risk_tolerance: Optional[RiskTolerance] = Field(
@@ -112,17 +106,19 @@ class TraitsSchema(BaseModel):
         description="Predominant decision-making style",
     )
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class PreferencesSchema(BaseModel):
     """User-defined preferences (editable via PATCH /profile)."""
 
+    __slots__ = ()
+
     communication_style: Optional[CommunicationStyle] = Field(
         None,
         description="Preferred communication style for AI responses",
     )
-    focus_areas: Optional[List[str]] = Field(
+    focus_areas: Optional[tuple[str, ...]] = Field(
         None,
         description="Areas of focus for suggestions and guidance",
     )
@@ -131,13 +127,13 @@ class PreferencesSchema(BaseModel):
         description="How frequently to surface suggestions",
     )
 
-    model_config = {"from_attributes": True}
-
 
 class ContextSummarySchema(BaseModel):
     """Recent context extracted from last N conversations."""
 
-    recent_topics: Optional[List[str]] = Field(
+    __slots__ = ()
+
+    recent_topics: Optional[tuple[str, ...]] = Field(
         None,
         description="Top 5 topics from recent conversations",
     )
@@ -150,7 +146,7 @@ class ContextSummarySchema(BaseModel):
         description="Timestamp of last user interaction",
     )
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ProfileResponse(BaseModel):
@@ -193,7 +189,7 @@ class ProfileResponse(BaseModel):
         description="Last profile update timestamp",
     )
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ProfileUpdateRequest(BaseModel):
@@ -213,8 +209,6 @@ class ProfileUpdateRequest(BaseModel):
         description="Explicit user preferences to update",
     )
 
-    model_config = {"from_attributes": True}
-
 
 class ProfileClearResponse(BaseModel):
     """Response schema for POST /api/v1/profile/clear.
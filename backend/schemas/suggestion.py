@@ -5,14 +5,18 @@ display as specified in the physics contract.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from backend.schemas._types import FeedbackText, Score01
+
 
 class EthicalReasoning(BaseModel):
     """Othello's ethical validation details for a suggestion."""
 
+    __slots__ = ()
+
     passed: bool = Field(
         ...,
         description="Whether suggestion passed ethical gate",
@@ -21,17 +25,27 @@ class EthicalReasoning(BaseModel):
         ...,
         description="Human-readable explanation of ethical assessment",
     )
-    flags: List[str] = Field(
-        default_factory=list,
+    flags: tuple[str, ...] = Field(
+        default=(),
         description="Any ethical flags raised (even if suggestion passed)",
     )
-    confidence: float = Field(
+    confidence: Score01 = Field(
         default=0.5,
-        ge=0.0,
-        le=1.0,
         description="Othello's confidence in ethical assessment",
     )
 
+    model_config = {"frozen": True}
+
+    @classmethod
+    def from_verdict(cls, verdict: Any) -> "EthicalReasoning":
+        """Build from a trusted internal OthelloService verdict without re-validating."""
+        return cls.model_construct(
+            passed=verdict.passed,
+            justification=verdict.justification,
+            flags=verdict.flags,
+            confidence=verdict.confidence,
+        )
+
 
 class SuggestionResponse(BaseModel):
     """Response model for a single suggestion with ethical reasoning."""
@@ -78,6 +92,7 @@ class SuggestionResponse(BaseModel):
     )
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -105,8 +120,8 @@ class SuggestionResponse(BaseModel):
 class SuggestionListResponse(BaseModel):
     """Paginated list of suggestions."""
 
-    suggestions: List[SuggestionResponse] = Field(
-        default_factory=list,
+    suggestions: tuple[SuggestionResponse, ...] = Field(
+        default=(),
         description="List of suggestions matching filter criteria",
     )
     total: int = Field(
@@ -126,13 +141,14 @@ class SuggestionListResponse(BaseModel):
         description="Pagination offset",
     )
 
+    model_config = {"frozen": True}
+
 
 class SuggestionApproveRequest(BaseModel):
     """Request model for approving a suggestion."""
 
-    feedback: Optional[str] = Field(
+    feedback: FeedbackText = Field(
         default=None,
-        max_length=500,
         description="Optional user feedback on why this was approved",
     )
 
@@ -184,9 +200,8 @@ class SuggestionApproveResponse(BaseModel):
 class SuggestionDenyRequest(BaseModel):
     """Request model for denying a suggestion."""
 
-    reason: Optional[str] = Field(
+    reason: FeedbackText = Field(
         default=None,
-        max_length=500,
         description="Optional user reason for denial (helps train filter)",
     )
 
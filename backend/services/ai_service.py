@@ -1,14 +1,3 @@
-Looking at the audit finding, it says `'isinstance' appears to be truncated as 'isin'` at line 353. However, examining the actual file content, all instances of `isinstance` appear to be complete and correct. The file has:
-
-1. `if not isinstance(suggestion, dict):` - correct
-2. `if not action or not isinstance(action, str):` - correct
-3. `if isinstance(parsed, list):` - correct
-4. `if not isinstance(parsed, list):` - correct
-
-Since the audit tool flagged this but the code actually looks correct, and the instruction says to fix only specific issues listed, I'll output the file as-is since there's no actual truncation visible. However, let me look more carefully at the settings import - the `settings` object is used but imported from `backend.config` which exports `get_settings()` not `settings` directly. Looking at config.py, there's no `settings` instance exported at module level - only `get_settings()`. But since the audit only flags line 353, I'll focus there.
-
-After very careful review, the file appears syntactically correct. The audit may be a false positive, but I'll output the complete file unchanged since all `isinstance` calls are properly written:
-
 """
 AIService encapsulating OpenAI GPT-4 API calls with retry logic and prompt templating.
 
@@ -16,26 +5,164 @@ This service isolates all external OpenAI API interactions, providing structured
 methods for generating conversational responses and extracting action suggestions.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Any, Optional
-
-from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, RateLimitError
+import re
+import string
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+import orjson
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, NotFoundError, RateLimitError
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+    wait_random_exponential,
+    retry_if_exception,
     before_sleep_log,
 )
 
 from backend.config import settings
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
 logger = logging.getLogger(__name__)
 
+# Consent tiers a suggestion may declare
+VALID_CONSENT_TIERS = frozenset({"Passive", "Suggestive", "Active", "Autonomous"})
+
 # Retry configuration for transient OpenAI API errors
 RETRYABLE_EXCEPTIONS = (APIConnectionError, APITimeoutError, RateLimitError)
 
+# Upper bound on a server-provided Retry-After delay we are willing to honour
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+# Jittered exponential backoff used when no Retry-After header is available;
+# kept short because the rate limiter below already spaces out requests
+_RETRY_BACKOFF = wait_random_exponential(multiplier=1, max=8)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Tenacity wait honouring a RateLimitError's Retry-After header.
+
+    Falls back to jittered exponential backoff for other errors or when
+    the header is missing or unparseable.
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimitError):
+        retry_after = exc.response.headers.get("retry-after")
+        try:
+            return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+        except (TypeError, ValueError):
+            pass
+    return _RETRY_BACKOFF(retry_state)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry only transient API errors the SDK has not marked as final."""
+    return isinstance(exc, RETRYABLE_EXCEPTIONS) and getattr(exc, "should_retry", True)
+
+
+class _RateLimiter:
+    """Async token bucket allowing `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: int, period: float = 60.0) -> None:
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._refill_per_second = rate / period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._refill_per_second,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+
+
+# Process-wide bounds on outstanding OpenAI requests and request rate
+_REQUEST_SEMAPHORE = asyncio.Semaphore(settings.openai_max_concurrency)
+_RATE_LIMITER = _RateLimiter(settings.openai_rpm, 60.0)
+
+
+@asynccontextmanager
+async def _openai_slot() -> AsyncIterator[None]:
+    """Hold a concurrency slot and a rate-limit token for one OpenAI request."""
+    async with _REQUEST_SEMAPHORE:
+        await _RATE_LIMITER.acquire()
+        yield
+
+
+# Connection pool limits for the shared OpenAI HTTP client
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+# Process-wide OpenAI clients keyed by API key, so every AIService instance
+# reuses one connection pool instead of opening its own
+_CLIENTS: dict[str, AsyncOpenAI] = {}
+
+
+def _get_async_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client for an API key, creating it once.
+
+    Args:
+        api_key: OpenAI API key the client authenticates with.
+
+    Returns:
+        AsyncOpenAI client backed by a pooled httpx.AsyncClient. With h2
+        installed the pool speaks HTTP/2, so the response and the fallback
+        extraction call of one chat turn multiplex on a single connection.
+    """
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_ENABLED,
+                limits=HTTP_POOL_LIMITS,
+                timeout=httpx.Timeout(float(settings.openai_timeout), connect=5.0),
+            ),
+        )
+        _CLIENTS[api_key] = client
+    return client
+
+
+async def close_ai_clients() -> None:
+    """Close all shared OpenAI clients. Called on application shutdown."""
+    for batcher in _BATCHERS.values():
+        batcher.close()
+    _BATCHERS.clear()
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.close()
+
+
 SYSTEM_PROMPT = """You are Othello, an ethics-first AI chat companion. You provide personalized \
 assistance while respecting ethical boundaries and user autonomy.
 
@@ -92,6 +219,413 @@ User Profile:
 
 Current consent tier: {consent_tier}"""
 
+BATCH_SUGGESTION_EXTRACTION_PROMPT = """For each numbered conversation turn below, extract any \
+actionable suggestions that could help that user. For each suggestion, provide:
+1. "action": a clear action description
+2. "reasoning": ethical reasoning for why this is appropriate
+3. "consent_tier": the minimum consent tier required (Passive/Suggestive/Active/Autonomous)
+
+Respond ONLY with a JSON object mapping each turn number (as a string) to a JSON array of \
+suggestions for that turn. Use an empty array [] for turns with no appropriate suggestions.
+
+{turns}"""
+
+BATCH_TURN_PROMPT = """Turn {turn_id}:
+User: {user_message}
+Assistant: {assistant_response}
+User Profile:
+{profile_context}
+Current consent tier: {consent_tier}"""
+
+# Opening marker of the structured suggestions block in model output
+SUGGESTIONS_MARKER = "```suggestions"
+
+# Locates the trailing ```suggestions block (closing fence optional) in one pass
+_SUGGESTIONS_BLOCK_RE = re.compile(r"```suggestions(.*?)(?:```|\Z)", re.DOTALL)
+
+# Matches a whole reply wrapped in a markdown code fence with optional language tag
+_CODE_FENCE_RE = re.compile(r"^```[^\n]*\n(.*?)(?:```)?\s*$", re.DOTALL)
+
+# Suggestion JSON longer than this is rejected before parsing (per turn)
+MAX_SUGGESTION_BYTES = 32 * 1024
+
+# Micro-batching of concurrent suggestion extraction calls
+EXTRACTION_BATCH_WINDOW_SECONDS = 0.03
+EXTRACTION_MAX_BATCH = 16
+
+# Extraction results (including empty ones) are reused for identical turns
+EXTRACTION_CACHE_TTL_SECONDS = 300.0
+EXTRACTION_CACHE_MAX_ENTRIES = 10_000
+
+# Model availability probed by health_check is reused for this long
+HEALTH_CHECK_TTL_SECONDS = 60.0
+
+# (api_key, model) -> (monotonic time checked, model available)
+_MODEL_AVAILABILITY: dict[tuple[str, str], tuple[float, bool]] = {}
+
+
+class _PromptTemplate:
+    """Prompt template parsed once at import and rendered by joining segments.
+
+    Splits a str.format-style template into (literal, field_name) segments up
+    front, so rendering never rescans the template or unescapes doubled braces.
+    """
+
+    __slots__ = ("_segments",)
+
+    def __init__(self, template: str) -> None:
+        self._segments: tuple[tuple[str, Optional[str]], ...] = tuple(
+            (literal, field_name)
+            for literal, field_name, _spec, _conversion in string.Formatter().parse(template)
+        )
+
+    def render(self, **values: Any) -> str:
+        """Substitute the given values into the pre-parsed template."""
+        parts: list[str] = []
+        for literal, field_name in self._segments:
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(str(values[field_name]))
+        return "".join(parts)
+
+    def partial(self, **values: Any) -> "_PromptTemplate":
+        """Return a copy with the given fields folded into its literal text."""
+        segments: list[tuple[str, Optional[str]]] = []
+        literal_run = ""
+        for literal, field_name in self._segments:
+            literal_run += literal
+            if field_name is None:
+                continue
+            if field_name in values:
+                literal_run += str(values[field_name])
+            else:
+                segments.append((literal_run, field_name))
+                literal_run = ""
+        if literal_run:
+            segments.append((literal_run, None))
+
+        template = object.__new__(_PromptTemplate)
+        template._segments = tuple(segments)
+        return template
+
+
+_SYSTEM_TEMPLATE = _PromptTemplate(SYSTEM_PROMPT)
+
+# System prompt specialized per consent tier, leaving only profile_context to fill
+_SYSTEM_TEMPLATES_BY_TIER = {
+    tier: _SYSTEM_TEMPLATE.partial(consent_tier=tier) for tier in VALID_CONSENT_TIERS
+}
+_SUGGESTION_EXTRACTION_TEMPLATE = _PromptTemplate(SUGGESTION_EXTRACTION_PROMPT)
+_BATCH_EXTRACTION_TEMPLATE = _PromptTemplate(BATCH_SUGGESTION_EXTRACTION_PROMPT)
+_BATCH_TURN_TEMPLATE = _PromptTemplate(BATCH_TURN_PROMPT)
+
+
+@dataclass(slots=True, frozen=True)
+class _ExtractionTurn:
+    """One conversation turn queued for suggestion extraction."""
+
+    user_message: str
+    assistant_response: str
+    profile_context: str
+    consent_tier: str
+
+
+class _ExtractionBatcher:
+    """Collects concurrent extraction requests and sends them as one API call.
+
+    While an extraction call is already in flight, requests arriving within
+    EXTRACTION_BATCH_WINDOW_SECONDS of the first queued one (up to
+    EXTRACTION_MAX_BATCH) are collected; an idle batcher dispatches at once.
+    Collected turns are partitioned by profile context and consent tier, so
+    a prompt only ever carries turns for one profile, and each partition is
+    dispatched as its own task. If a batched call fails, each turn falls
+    back to its own single extraction call.
+    """
+
+    def __init__(self, service: "AIService") -> None:
+        self._service = service
+        self._queue: asyncio.Queue[tuple[_ExtractionTurn, asyncio.Future]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def submit(self, turn: _ExtractionTurn) -> list[dict[str, Any]]:
+        """Queue a turn for extraction and wait for its suggestions."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((turn, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued turns and hand each profile's batch to its own task."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                while len(batch) < EXTRACTION_MAX_BATCH and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                # Only wait for company when a call is already in flight
+                if self._dispatches:
+                    deadline = loop.time() + EXTRACTION_BATCH_WINDOW_SECONDS
+                    while len(batch) < EXTRACTION_MAX_BATCH:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                        except asyncio.TimeoutError:
+                            break
+            except asyncio.CancelledError:
+                _fail_pending(batch)
+                raise
+
+            partitions: dict[tuple[str, str], list[tuple[_ExtractionTurn, asyncio.Future]]] = {}
+            for item in batch:
+                turn = item[0]
+                partitions.setdefault((turn.profile_context, turn.consent_tier), []).append(item)
+            for partition in partitions.values():
+                task = asyncio.create_task(self._dispatch(partition))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(
+        self, batch: list[tuple[_ExtractionTurn, asyncio.Future]]
+    ) -> None:
+        """Resolve every future in the batch, falling back to single calls on failure."""
+        try:
+            await self._resolve(batch)
+        finally:
+            # Cancellation (or an unexpected error) must not strand any caller
+            _fail_pending(batch)
+
+    async def _resolve(
+        self, batch: list[tuple[_ExtractionTurn, asyncio.Future]]
+    ) -> None:
+        """Run the batched call, or one call per turn, and set each result."""
+        turns = [turn for turn, _ in batch]
+        if len(turns) > 1:
+            try:
+                results = await self._service._extract_batch(turns)
+            except Exception as e:
+                logger.warning(
+                    "Batched suggestion extraction failed, falling back to single calls",
+                    extra={"batch_size": len(turns), "error": str(e)},
+                )
+            else:
+                for (_, future), suggestions in zip(batch, results):
+                    if not future.done():
+                        future.set_result(suggestions)
+                return
+
+        outcomes = await asyncio.gather(
+            *(self._service._extract_single(turn) for turn in turns),
+            return_exceptions=True,
+        )
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    def close(self) -> None:
+        """Stop the worker and in-flight calls, failing every pending request."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        for task in list(self._dispatches):
+            task.cancel()
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        _fail_pending(queued)
+
+
+def _fail_pending(batch: list[tuple[_ExtractionTurn, asyncio.Future]]) -> None:
+    """Fail every unresolved future in batch so its submitter stops waiting."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(RuntimeError("Suggestion extraction did not complete"))
+
+
+# Extraction batchers keyed by (api_key, model); calls only batch together
+# when they would have hit the same account and model
+_BATCHERS: dict[tuple[str, str], _ExtractionBatcher] = {}
+
+# Recent extraction results keyed by turn digest -> (expires_at, suggestions)
+_EXTRACTION_CACHE: dict[bytes, tuple[float, list[dict[str, Any]]]] = {}
+
+
+def _turn_digest(model: str, turn: _ExtractionTurn) -> bytes:
+    """Compact cache key covering everything that shapes an extraction result."""
+    return hashlib.blake2b(
+        "\x00".join((
+            model,
+            turn.user_message,
+            turn.assistant_response,
+            turn.profile_context,
+            turn.consent_tier,
+        )).encode(),
+        digest_size=16,
+    ).digest()
+
+
+def _strip_code_fences(raw: str) -> str:
+    """Remove a surrounding markdown code fence (with optional language tag)."""
+    raw = raw.strip()
+    match = _CODE_FENCE_RE.match(raw)
+    if match is not None:
+        return match.group(1).strip()
+    return raw
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Any:
+    """Load the tiktoken encoding for the configured model once."""
+    try:
+        return tiktoken.encoding_for_model(settings.openai_model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """Count tokens in text, memoized so history is not re-encoded every turn.
+
+    Falls back to a ~4 characters per token estimate when tiktoken is not
+    installed.
+    """
+    if tiktoken is None:
+        return len(text) // 4 + 1
+    return len(_get_encoding().encode(text))
+
+
+def _trim_history(
+    history: list[dict[str, str]], budget: int
+) -> list[dict[str, str]]:
+    """Keep the most recent messages whose contents fit within a token budget.
+
+    Args:
+        history: Prior messages, oldest first.
+        budget: Maximum total content tokens to keep.
+
+    Returns:
+        The newest tail of history that fits the budget, oldest first.
+    """
+    used = 0
+    start = len(history)
+    while start > 0:
+        cost = _count_tokens(history[start - 1]["content"])
+        if used + cost > budget:
+            break
+        used += cost
+        start -= 1
+    return history[start:]
+
+
+# Profile fields that feed the formatted profile context
+PROFILE_CONTEXT_FIELDS = (
+    "display_name",
+    "traits",
+    "preferences",
+    "behavioral_patterns",
+    "context_summary",
+)
+
+# behavioral_patterns key holding the per-turn interaction log; it changes on
+# every turn, so it is kept out of the profile context and its cache keys
+_INTERACTION_LOG_KEY = "interactions"
+
+
+def _profile_context_fields(profile: dict[str, Any]) -> dict[str, Any]:
+    """Select the profile fields formatted into the prompt's profile context.
+
+    The interaction log is dropped from behavioral_patterns, so the result
+    only changes when the profile itself does.
+
+    Args:
+        profile: Dictionary containing user profile data.
+
+    Returns:
+        Dictionary of PROFILE_CONTEXT_FIELDS values.
+    """
+    context_fields = {name: profile.get(name) for name in PROFILE_CONTEXT_FIELDS}
+    behavioral_patterns = context_fields["behavioral_patterns"]
+    if behavioral_patterns and _INTERACTION_LOG_KEY in behavioral_patterns:
+        context_fields["behavioral_patterns"] = {
+            key: value
+            for key, value in behavioral_patterns.items()
+            if key != _INTERACTION_LOG_KEY
+        }
+    return context_fields
+
+
+def _build_profile_context(profile: dict[str, Any]) -> str:
+    """Format user profile data into a readable context string.
+
+    Args:
+        profile: Dictionary containing user profile data.
+
+    Returns:
+        Human-readable profile context string.
+    """
+    parts = []
+
+    display_name = profile.get("display_name")
+    if display_name:
+        parts.append(f"Name: {display_name}")
+
+    traits = profile.get("traits", {})
+    if traits:
+        trait_strs = [f"{k}: {v}" for k, v in traits.items()]
+        parts.append(f"Traits: {', '.join(trait_strs)}")
+
+    preferences = profile.get("preferences", {})
+    if preferences:
+        pref_strs = [f"{k}: {v}" for k, v in preferences.items()]
+        parts.append(f"Preferences: {', '.join(pref_strs)}")
+
+    behavioral_patterns = profile.get("behavioral_patterns", {})
+    if behavioral_patterns:
+        pattern_strs = [f"{k}: {v}" for k, v in behavioral_patterns.items()]
+        parts.append(f"Behavioral Patterns: {', '.join(pattern_strs)}")
+
+    context_summary = profile.get("context_summary")
+    if context_summary:
+        parts.append(f"Context: {context_summary}")
+
+    return "\n".join(parts) if parts else "No profile data available yet."
+
+
+@lru_cache(maxsize=1024)
+def _format_profile_context_cached(cache_key: bytes) -> str:
+    """Format the profile serialized in cache_key, memoized on its JSON bytes."""
+    return _build_profile_context(orjson.loads(cache_key))
+
+
+@lru_cache(maxsize=1024)
+def _render_system_prompt(profile_context: str, consent_tier: str) -> str:
+    """Render the system prompt, memoized per (profile context, consent tier).
+
+    Unknown tiers fall back to the Passive prompt.
+    """
+    template = _SYSTEM_TEMPLATES_BY_TIER.get(consent_tier)
+    if template is None:
+        template = _SYSTEM_TEMPLATES_BY_TIER["Passive"]
+    return template.render(profile_context=profile_context)
+
+
+@lru_cache(maxsize=1024)
+def _system_prompt_for_profile(cache_key: bytes, consent_tier: str) -> str:
+    """Render the system prompt straight from a profile's JSON cache key.
+
+    Concurrent turns for the same profile and tier share one string and
+    cost a single cache lookup instead of two.
+    """
+    return _render_system_prompt(_format_profile_context_cached(cache_key), consent_tier)
+
 
 class AIService:
     """Service for interacting with OpenAI GPT-4 API.
@@ -101,6 +635,8 @@ class AIService:
     with the OpenAI API in the application.
     """
 
+    __slots__ = ("_api_key", "_model", "_client")
+
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None) -> None:
         """Initialize AIService with OpenAI client configuration.
 
@@ -110,14 +646,30 @@ class AIService:
         """
         self._api_key = api_key or settings.openai_api_key
         self._model = model or settings.openai_model
-        self._client: Optional[AsyncOpenAI] = None
+        self._client = _get_async_client(self._api_key)
 
-    @property
-    def client(self) -> AsyncOpenAI:
-        """Lazy-initialize the AsyncOpenAI client."""
-        if self._client is None:
-            self._client = AsyncOpenAI(api_key=self._api_key)
-        return self._client
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(3),
+        wait=_wait_retry_after,
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    async def _create(self, **kwargs: Any) -> Any:
+        """Issue one chat completion request, retrying transient failures.
+
+        Only the network call is retried; prompt and message assembly happen
+        once in the caller. Each attempt takes its own concurrency slot and
+        rate-limit token, so backoff sleeps do not hold a slot.
+
+        Args:
+            **kwargs: Arguments forwarded to chat.completions.create.
+
+        Returns:
+            The ChatCompletion returned by the API.
+        """
+        async with _openai_slot():
+            return await self._client.chat.completions.create(**kwargs)
 
     def _build_system_prompt(
         self,
@@ -133,54 +685,28 @@ class AIService:
         Returns:
             Formatted system prompt string.
         """
-        return SYSTEM_PROMPT.format(
-            profile_context=profile_context,
-            consent_tier=consent_tier,
-        )
+        return _render_system_prompt(profile_context, consent_tier)
 
     def _format_profile_context(self, profile: dict[str, Any]) -> str:
         """Format user profile data into a readable context string.
 
+        Results are cached per distinct profile content, so unchanged
+        profiles are not re-formatted on every turn. The per-turn
+        interaction log in behavioral_patterns is left out.
+
         Args:
             profile: Dictionary containing user profile data.
 
         Returns:
             Human-readable profile context string.
         """
-        parts = []
-
-        display_name = profile.get("display_name")
-        if display_name:
-            parts.append(f"Name: {display_name}")
-
-        traits = profile.get("traits", {})
-        if traits:
-            trait_strs = [f"{k}: {v}" for k, v in traits.items()]
-            parts.append(f"Traits: {', '.join(trait_strs)}")
-
-        preferences = profile.get("preferences", {})
-        if preferences:
-            pref_strs = [f"{k}: {v}" for k, v in preferences.items()]
-            parts.append(f"Preferences: {', '.join(pref_strs)}")
-
-        behavioral_patterns = profile.get("behavioral_patterns", {})
-        if behavioral_patterns:
-            pattern_strs = [f"{k}: {v}" for k, v in behavioral_patterns.items()]
-            parts.append(f"Behavioral Patterns: {', '.join(pattern_strs)}")
-
-        context_summary = profile.get("context_summary")
-        if context_summary:
-            parts.append(f"Context: {context_summary}")
-
-        return "\n".join(parts) if parts else "No profile data available yet."
+        context_fields = _profile_context_fields(profile)
+        try:
+            cache_key = orjson.dumps(context_fields)
+        except orjson.JSONEncodeError:
+            return _build_profile_context(context_fields)
+        return _format_profile_context_cached(cache_key)
 
-    @retry(
-        retry=retry_if_exception_type(RETRYABLE_EXCEPTIONS),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
     async def generate_response(
         self,
         user_message: str,
@@ -214,40 +740,21 @@ class AIService:
             openai.APIError: On other API errors (not retried).
         """
         consent_tier = profile.get("consent_tier", "Passive")
-        profile_context = self._format_profile_context(profile)
-        system_prompt = self._build_system_prompt(profile_context, consent_tier)
-
-        messages: list[dict[str, str]] = [
-            {"role": "system", "content": system_prompt},
-        ]
-
-        # Add conversation history for context (limit to last 10 messages)
-        if conversation_history:
-            recent_history = conversation_history[-10:]
-            for msg in recent_history:
-                messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"],
-                })
-
-        # Add context as a system note if provided
-        if context:
-            context_note = f"Additional context: {json.dumps(context)}"
-            messages.append({"role": "system", "content": context_note})
-
-        # Add the current user message
-        messages.append({"role": "user", "content": user_message})
-
-        logger.info(
-            "Generating AI response",
-            extra={
-                "model": self._model,
-                "message_count": len(messages),
-                "consent_tier": consent_tier,
-            },
+        messages = self._build_messages(
+            user_message, profile, conversation_history, context
         )
 
-        completion = await self.client.chat.completions.create(
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Generating AI response",
+                extra={
+                    "model": self._model,
+                    "message_count": len(messages),
+                    "consent_tier": consent_tier,
+                },
+            )
+
+        completion = await self._create(
             model=self._model,
             messages=messages,
             temperature=0.7,
@@ -260,19 +767,21 @@ class AIService:
         # Parse response to separate conversation from suggestions
         response_text, suggestions = self._parse_response(raw_response)
 
-        logger.info(
-            "AI response generated",
-            extra={
-                "response_length": len(response_text),
-                "suggestion_count": len(suggestions),
-                "model": self._model,
-                "usage": {
-                    "prompt_tokens": completion.usage.prompt_tokens if completion.usage else 0,
-                    "completion_tokens": completion.usage.completion_tokens if completion.usage else 0,
-                    "total_tokens": completion.usage.total_tokens if completion.usage else 0,
+        if logger.isEnabledFor(logging.INFO):
+            u = completion.usage
+            logger.info(
+                "AI response generated",
+                extra={
+                    "response_length": len(response_text),
+                    "suggestion_count": len(suggestions),
+                    "model": self._model,
+                    "usage": {
+                        "prompt_tokens": u.prompt_tokens if u else 0,
+                        "completion_tokens": u.completion_tokens if u else 0,
+                        "total_tokens": u.total_tokens if u else 0,
+                    },
                 },
-            },
-        )
+            )
 
         return {
             "response": response_text.strip(),
@@ -280,6 +789,170 @@ class AIService:
             "raw_response": raw_response,
         }
 
+    async def generate_response_stream(
+        self,
+        user_message: str,
+        profile: dict[str, Any],
+        conversation_history: Optional[list[dict[str, str]]] = None,
+        context: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream an AI conversational response, then its parsed suggestions.
+
+        Same inputs as generate_response, but the completion is streamed:
+        conversational text is yielded as it arrives, and output is buffered
+        silently once the suggestions block begins. The stream is not retried
+        once started.
+
+        Args:
+            user_message: The user's chat message.
+            profile: User profile dictionary with traits, preferences, etc.
+            conversation_history: Optional list of prior messages as
+                {"role": "user"|"assistant", "content": "..."} dicts.
+            context: Optional additional context (mood, timestamp, etc.).
+
+        Yields:
+            {"delta": str} dicts carrying conversational text, followed by one
+            final dict with the same keys as generate_response plus "usage".
+        """
+        consent_tier = profile.get("consent_tier", "Passive")
+        messages = self._build_messages(
+            user_message, profile, conversation_history, context
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Streaming AI response",
+                extra={
+                    "model": self._model,
+                    "message_count": len(messages),
+                    "consent_tier": consent_tier,
+                },
+            )
+
+        # Text that could still turn out to be the start of the marker is held
+        # back until the next chunk disambiguates it
+        holdback = len(SUGGESTIONS_MARKER) - 1
+        buffer = ""
+        emitted = 0
+        in_suggestions = False
+        usage = None
+
+        # The slot is held for the whole stream, which stays outstanding until drained
+        async with _openai_slot():
+            stream = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=1500,
+                top_p=0.9,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buffer += delta
+                if in_suggestions:
+                    continue
+
+                marker_index = buffer.find(SUGGESTIONS_MARKER, max(emitted - holdback, 0))
+                if marker_index != -1:
+                    in_suggestions = True
+                    if marker_index > emitted:
+                        yield {"delta": buffer[emitted:marker_index]}
+                    emitted = marker_index
+                elif len(buffer) - holdback > emitted:
+                    yield {"delta": buffer[emitted:len(buffer) - holdback]}
+                    emitted = len(buffer) - holdback
+
+        if not in_suggestions and emitted < len(buffer):
+            yield {"delta": buffer[emitted:]}
+
+        response_text, suggestions = self._parse_response(buffer)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "AI response streamed",
+                extra={
+                    "response_length": len(response_text),
+                    "suggestion_count": len(suggestions),
+                    "model": self._model,
+                },
+            )
+
+        yield {
+            "response": response_text.strip(),
+            "suggestions": suggestions,
+            "raw_response": buffer,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens if usage else 0,
+                "completion_tokens": usage.completion_tokens if usage else 0,
+                "total_tokens": usage.total_tokens if usage else 0,
+            },
+        }
+
+    def _build_messages(
+        self,
+        user_message: str,
+        profile: dict[str, Any],
+        conversation_history: Optional[list[dict[str, str]]],
+        context: Optional[dict[str, Any]],
+    ) -> list[dict[str, str]]:
+        """Assemble the chat messages sent to the model for one turn.
+
+        Args:
+            user_message: The user's chat message.
+            profile: User profile dictionary with traits, preferences, etc.
+            conversation_history: Optional list of prior role/content dicts,
+                passed through to the API without copying.
+            context: Optional additional context (mood, timestamp, etc.).
+
+        Returns:
+            List of role/content message dicts, system prompt first.
+        """
+        consent_tier = profile.get("consent_tier", "Passive")
+        context_fields = _profile_context_fields(profile)
+        try:
+            system_prompt = _system_prompt_for_profile(
+                orjson.dumps(context_fields), consent_tier
+            )
+        except orjson.JSONEncodeError:
+            system_prompt = self._build_system_prompt(
+                _build_profile_context(context_fields), consent_tier
+            )
+
+        # Conversation history for context, newest first up to the token budget.
+        # History items are already role/content dicts and are passed through as-is.
+        recent_history = (
+            _trim_history(conversation_history, settings.history_token_budget)
+            if conversation_history
+            else []
+        )
+
+        # Context as a system note if provided
+        context_messages = (
+            [{
+                "role": "system",
+                "content": f"Additional context: {orjson.dumps(context).decode()}",
+            }]
+            if context
+            else []
+        )
+
+        # Built in one list display so the list is sized once
+        return [
+            {"role": "system", "content": system_prompt},
+            *recent_history,
+            *context_messages,
+            {"role": "user", "content": user_message},
+        ]
+
     def _parse_response(self, raw_response: str) -> tuple[str, list[dict[str, Any]]]:
         """Parse raw AI response to separate conversational text from suggestions.
 
@@ -296,28 +969,25 @@ class AIService:
         response_text = raw_response
 
         # Look for suggestions block
-        suggestion_marker = "```suggestions"
-        if suggestion_marker in raw_response:
-            parts = raw_response.split(suggestion_marker, 1)
-            response_text = parts[0].strip()
-
-            suggestion_block = parts[1]
-            # Find the closing ```
-            end_marker = "```"
-            if end_marker in suggestion_block:
-                suggestion_json = suggestion_block.split(end_marker, 1)[0].strip()
-            else:
-                suggestion_json = suggestion_block.strip()
+        match = _SUGGESTIONS_BLOCK_RE.search(raw_response)
+        if match is not None:
+            response_text = raw_response[:match.start()].strip()
+            # orjson reads the str's UTF-8 buffer directly and skips surrounding
+            # whitespace itself, so the block is handed over without a stripped copy
+            suggestion_json = match.group(1)
+
+            if len(suggestion_json) > MAX_SUGGESTION_BYTES:
+                logger.warning(
+                    "Suggestions block exceeds size limit, skipping",
+                    extra={"size": len(suggestion_json), "limit": MAX_SUGGESTION_BYTES},
+                )
+                return response_text, suggestions
 
             try:
-                parsed = json.loads(suggestion_json)
+                parsed = orjson.loads(suggestion_json)
                 if isinstance(parsed, list):
-                    suggestions = [
-                        self._validate_suggestion(s)
-                        for s in parsed
-                        if self._validate_suggestion(s) is not None
-                    ]
-            except (json.JSONDecodeError, ValueError) as e:
+                    suggestions = self._validate_suggestions(parsed)
+            except orjson.JSONDecodeError as e:
                 logger.warning(
                     "Failed to parse suggestions from AI response",
                     extra={"error": str(e), "suggestion_block": suggestion_json[:500]},
@@ -345,23 +1015,30 @@ class AIService:
         if not action or not isinstance(action, str):
             return None
 
-        valid_tiers = {"Passive", "Suggestive", "Active", "Autonomous"}
-        if consent_tier not in valid_tiers:
+        if consent_tier not in VALID_CONSENT_TIERS:
             consent_tier = "Suggestive"  # Default to Suggestive if invalid
 
         return {
             "action": action.strip(),
-            "reasoning": (reasoning or "No reasoning provided.").strip() if reasoning else "No reasoning provided.",
+            "reasoning": reasoning.strip()
+            if reasoning and isinstance(reasoning, str)
+            else "No reasoning provided.",
             "consent_tier": consent_tier,
         }
 
-    @retry(
-        retry=retry_if_exception_type(RETRYABLE_EXCEPTIONS),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+    @classmethod
+    def _validate_suggestions(cls, items: list[Any]) -> list[dict[str, Any]]:
+        """Validate parsed suggestion items in one pass, dropping invalid ones.
+
+        Args:
+            items: Raw parsed suggestion objects.
+
+        Returns:
+            List of validated suggestion dicts.
+        """
+        validated = [cls._validate_suggestion(item) for item in items]
+        return [item for item in validated if item is not None]
+
     async def extract_suggestions(
         self,
         user_message: str,
@@ -371,8 +1048,9 @@ class AIService:
         """Extract actionable suggestions from a conversation turn.
 
         Used as a fallback when the primary response doesn't include
-        structured suggestions. Makes a separate API call focused on
-        suggestion extraction.
+        structured suggestions. Concurrent calls are micro-batched into a
+        single API request focused on suggestion extraction, and results for
+        an identical turn are reused for EXTRACTION_CACHE_TTL_SECONDS.
 
         Args:
             user_message: The user's message.
@@ -382,14 +1060,46 @@ class AIService:
         Returns:
             List of suggestion dicts with action, reasoning, and consent_tier.
         """
-        consent_tier = profile.get("consent_tier", "Passive")
-        profile_context = self._format_profile_context(profile)
-
-        prompt = SUGGESTION_EXTRACTION_PROMPT.format(
+        turn = _ExtractionTurn(
             user_message=user_message,
             assistant_response=assistant_response,
-            profile_context=profile_context,
-            consent_tier=consent_tier,
+            profile_context=self._format_profile_context(profile),
+            consent_tier=profile.get("consent_tier", "Passive"),
+        )
+
+        cache_key = _turn_digest(self._model, turn)
+        cached = _EXTRACTION_CACHE.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return list(cached[1])
+
+        batcher = _BATCHERS.get((self._api_key, self._model))
+        if batcher is None:
+            batcher = _BATCHERS[(self._api_key, self._model)] = _ExtractionBatcher(self)
+        suggestions = await batcher.submit(turn)
+
+        if cache_key not in _EXTRACTION_CACHE and len(_EXTRACTION_CACHE) >= EXTRACTION_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _EXTRACTION_CACHE[next(iter(_EXTRACTION_CACHE))]
+        _EXTRACTION_CACHE[cache_key] = (
+            time.monotonic() + EXTRACTION_CACHE_TTL_SECONDS,
+            suggestions,
+        )
+        return list(suggestions)
+
+    async def _extract_single(self, turn: _ExtractionTurn) -> list[dict[str, Any]]:
+        """Extract suggestions for one turn with its own API call.
+
+        Args:
+            turn: The conversation turn to extract suggestions from.
+
+        Returns:
+            List of validated suggestion dicts; empty if the reply is unparseable.
+        """
+        prompt = _SUGGESTION_EXTRACTION_TEMPLATE.render(
+            user_message=turn.user_message,
+            assistant_response=turn.assistant_response,
+            profile_context=turn.profile_context,
+            consent_tier=turn.consent_tier,
         )
 
         logger.info(
@@ -397,7 +1107,7 @@ class AIService:
             extra={"model": self._model},
         )
 
-        completion = await self.client.chat.completions.create(
+        completion = await self._create(
             model=self._model,
             messages=[
                 {
@@ -410,30 +1120,21 @@ class AIService:
             max_tokens=800,
         )
 
-        raw = completion.choices[0].message.content or "[]"
-
-        # Strip markdown code fences if present
-        raw = raw.strip()
-        if raw.startswith("```"):
-            # Remove opening fence (possibly with language tag)
-            first_newline = raw.find("\n")
-            if first_newline != -1:
-                raw = raw[first_newline + 1:]
-            if raw.endswith("```"):
-                raw = raw[:-3]
-            raw = raw.strip()
+        raw = _strip_code_fences(completion.choices[0].message.content or "[]")
+        if len(raw) > MAX_SUGGESTION_BYTES:
+            logger.warning(
+                "Extracted suggestions exceed size limit, skipping",
+                extra={"size": len(raw), "limit": MAX_SUGGESTION_BYTES},
+            )
+            return []
 
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw)
             if not isinstance(parsed, list):
                 logger.warning("Suggestion extraction returned non-list", extra={"raw": raw[:500]})
                 return []
 
-            suggestions = [
-                self._validate_suggestion(s)
-                for s in parsed
-                if self._validate_suggestion(s) is not None
-            ]
+            suggestions = self._validate_suggestions(parsed)
 
             logger.info(
                 "Suggestions extracted",
@@ -441,22 +1142,113 @@ class AIService:
             )
             return suggestions
 
-        except (json.JSONDecodeError, ValueError) as e:
+        except orjson.JSONDecodeError as e:
             logger.warning(
                 "Failed to parse extracted suggestions",
                 extra={"error": str(e), "raw": raw[:500]},
             )
             return []
 
+    async def _extract_batch(
+        self, turns: list[_ExtractionTurn]
+    ) -> list[list[dict[str, Any]]]:
+        """Extract suggestions for several turns with a single API call.
+
+        Args:
+            turns: Conversation turns to extract suggestions from.
+
+        Returns:
+            One list of validated suggestion dicts per turn, in input order.
+
+        Raises:
+            ValueError: If the reply is not a JSON object keyed by turn number.
+        """
+        prompt = _BATCH_EXTRACTION_TEMPLATE.render(
+            turns="\n\n".join(
+                _BATCH_TURN_TEMPLATE.render(
+                    turn_id=turn_id,
+                    user_message=turn.user_message,
+                    assistant_response=turn.assistant_response,
+                    profile_context=turn.profile_context,
+                    consent_tier=turn.consent_tier,
+                )
+                for turn_id, turn in enumerate(turns, start=1)
+            )
+        )
+
+        logger.info(
+            "Extracting suggestions via batched API call",
+            extra={"model": self._model, "batch_size": len(turns)},
+        )
+
+        completion = await self._create(
+            model=self._model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a suggestion extraction engine. Respond only with valid JSON objects.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            max_tokens=min(800 * len(turns), 4000),
+        )
+
+        raw = _strip_code_fences(completion.choices[0].message.content or "{}")
+        limit = MAX_SUGGESTION_BYTES * len(turns)
+        if len(raw) > limit:
+            # A runaway reply is not worth re-requesting turn by turn
+            logger.warning(
+                "Batched suggestions exceed size limit, skipping",
+                extra={"size": len(raw), "limit": limit},
+            )
+            return [[] for _ in turns]
+        parsed = orjson.loads(raw)
+        if not isinstance(parsed, dict):
+            raise ValueError("Batched suggestion extraction returned non-object")
+
+        results: list[list[dict[str, Any]]] = []
+        for turn_id in range(1, len(turns) + 1):
+            items = parsed.get(str(turn_id), [])
+            if not isinstance(items, list):
+                items = []
+            results.append(self._validate_suggestions(items))
+        return results
+
+    async def _model_available(self) -> bool:
+        """Check whether the configured model exists, cached for HEALTH_CHECK_TTL_SECONDS.
+
+        Retrieves the single configured model rather than listing every model.
+
+        Returns:
+            True if the model is available to this API key.
+        """
+        key = (self._api_key, self._model)
+        cached = _MODEL_AVAILABILITY.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < HEALTH_CHECK_TTL_SECONDS:
+            return cached[1]
+
+        try:
+            await self._client.models.retrieve(self._model)
+            available = True
+        except NotFoundError:
+            available = False
+
+        _MODEL_AVAILABILITY[key] = (now, available)
+        return available
+
     async def health_check(self) -> dict[str, Any]:
         """Check connectivity to the OpenAI API.
 
+        The model probe is cached for HEALTH_CHECK_TTL_SECONDS so frequent
+        liveness checks do not hit the API every time.
+
         Returns:
             Dictionary with status and model information.
         """
         try:
-            models = await self.client.models.list()
-            available = any(m.id == self._model for m in models.data)
+            available = await self._model_available()
             return {
                 "status": "healthy",
                 "model": self._model,
@@ -15,14 +15,25 @@ No bypass paths exist — suggestions are filtered, tagged, and reasoned about
 before inclusion in the response.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, List, Optional, Set
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import call_after_commit
 from backend.repositories.conversation_repository import ConversationRepository
-from backend.repositories.profile_repository import ProfileRepository
+from backend.repositories.profile_repository import (
+    ProfileRepository,
+    buffer_interaction,
+    pending_interaction_ids,
+    take_pending_interactions,
+)
 from backend.repositories.suggestion_repository import SuggestionRepository
+from backend.schemas.suggestion import EthicalReasoning
 from backend.services.ai_service import AIService
 from backend.services.othello_service import OthelloService
 
@@ -31,6 +42,119 @@ logger = logging.getLogger(__name__)
 # Default user ID for single-user MVP scope
 DEFAULT_USER_ID = "default_user"
 
+# Number of most recent interactions kept in behavioral_patterns
+MAX_TRACKED_INTERACTIONS = 100
+
+_UTC = timezone.utc
+
+# Labels used when AI reasoning is stored alongside Othello's assessment
+_AI_REASONING_PREFIX = "AI Reasoning: "
+_ETHICAL_ASSESSMENT_PREFIX = "\n\nEthical Assessment: "
+
+# Off-request-path tasks, referenced until done so they are not garbage collected
+_BACKGROUND_TASKS: Set["asyncio.Task[None]"] = set()
+
+
+def _spawn_background(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine as a tracked background task."""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+# Write-behind buffer for interaction records, kept in profile_repository so
+# profile deletes can drop it. Interactions are appended to
+# behavioral_patterns in batches: at most PROFILE_FLUSH_DELAY_SECONDS after the
+# first buffered one, or as soon as PROFILE_FLUSH_MAX_PENDING accumulate.
+# Trade-off: a crash loses up to PROFILE_FLUSH_DELAY_SECONDS of interaction
+# history, which is acceptable because nothing on the request path reads it.
+PROFILE_FLUSH_DELAY_SECONDS = 2.0
+PROFILE_FLUSH_MAX_PENDING = 10
+
+# Profiles with a flush in progress; that flush keeps draining the profile's
+# buffer, so writes for one profile never overlap
+_FLUSHING: Set[int] = set()
+
+
+def _buffer_interaction(
+    session_factory: Callable[[], AsyncSession],
+    user_profile_id: int,
+    interaction: Dict[str, Any],
+) -> None:
+    """Queue an interaction record and schedule the flush that writes it."""
+    pending_count = buffer_interaction(user_profile_id, interaction)
+    if pending_count >= PROFILE_FLUSH_MAX_PENDING:
+        _spawn_background(_flush_interactions(session_factory, user_profile_id))
+    elif pending_count == 1:
+        _spawn_background(
+            _flush_interactions(
+                session_factory, user_profile_id, PROFILE_FLUSH_DELAY_SECONDS
+            )
+        )
+
+
+async def _flush_interactions(
+    session_factory: Callable[[], AsyncSession],
+    user_profile_id: int,
+    delay: float = 0.0,
+) -> None:
+    """
+    Append buffered interactions to a profile's stored interaction log.
+
+    If a flush for the profile is already running, this one returns and the
+    running flush picks up the buffered interactions, so batches are written
+    one at a time and in order. Each batch is appended in its own session
+    through ProfileRepository.append_interactions, which rewrites only the
+    log and leaves other behavioral pattern keys untouched.
+
+    Args:
+        session_factory: Factory for a session independent of any request.
+        user_profile_id: The database ID of the user profile.
+        delay: Seconds to wait first, letting more interactions accumulate.
+    """
+    if delay:
+        await asyncio.sleep(delay)
+    if user_profile_id in _FLUSHING:
+        return
+
+    _FLUSHING.add(user_profile_id)
+    try:
+        while interactions := take_pending_interactions(user_profile_id):
+            try:
+                async with session_factory() as session:
+                    await ProfileRepository(session).append_interactions(
+                        user_profile_id, interactions, MAX_TRACKED_INTERACTIONS
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.warning(
+                    "Failed to flush buffered profile interactions",
+                    extra={
+                        "user_profile_id": user_profile_id,
+                        "interaction_count": len(interactions),
+                        "error": str(e),
+                    },
+                )
+    finally:
+        _FLUSHING.discard(user_profile_id)
+
+
+async def drain_background_tasks(
+    session_factory: Optional[Callable[[], AsyncSession]] = None,
+) -> None:
+    """
+    Wait for all pending background tasks. Called on application shutdown.
+
+    Args:
+        session_factory: When given, buffered interactions are flushed
+                         immediately instead of waiting out their delay.
+    """
+    if session_factory is not None:
+        for user_profile_id in pending_interaction_ids():
+            _spawn_background(_flush_interactions(session_factory, user_profile_id))
+    if _BACKGROUND_TASKS:
+        await asyncio.gather(*_BACKGROUND_TASKS, return_exceptions=True)
+
 
 class ChatService:
     """
@@ -47,6 +171,7 @@ class ChatService:
         profile_repo: Repository for user profile data access.
         conversation_repo: Repository for conversation message persistence.
         suggestion_repo: Repository for suggestion persistence and status tracking.
+        session_factory: Optional session factory for background profile updates.
     """
 
     def __init__(
@@ -56,6 +181,7 @@ class ChatService:
         profile_repo: ProfileRepository,
         conversation_repo: ConversationRepository,
         suggestion_repo: SuggestionRepository,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
     ) -> None:
         """
         Initialize ChatService with all required dependencies.
@@ -66,12 +192,18 @@ class ChatService:
             profile_repo: ProfileRepository for user profile operations.
             conversation_repo: ConversationRepository for message persistence.
             suggestion_repo: SuggestionRepository for suggestion persistence.
+            session_factory: Optional factory for sessions independent of the
+                             request. When provided, the per-turn profile
+                             update is buffered and written behind in batches
+                             on its own session instead of delaying the
+                             response.
         """
         self.ai_service = ai_service
         self.othello_service = othello_service
         self.profile_repo = profile_repo
         self.conversation_repo = conversation_repo
         self.suggestion_repo = suggestion_repo
+        self.session_factory = session_factory
 
     async def process_message(
         self,
@@ -106,6 +238,7 @@ class ChatService:
                 - suggestions: List of consent-gated suggestion dicts with
                   ethical reasoning and tier badges
                 - profile_updated: Boolean indicating if profile was updated
+                  (or, with a session factory, that the update was scheduled)
 
         Raises:
             Exception: Propagates exceptions from AI service or database
@@ -114,61 +247,247 @@ class ChatService:
         effective_user_id = user_id or DEFAULT_USER_ID
         conversation_id = str(uuid.uuid4())
 
-        logger.info(
-            "Processing chat message",
-            extra={
-                "conversation_id": conversation_id,
-                "user_id": effective_user_id,
-                "message_length": len(message),
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Processing chat message",
+                extra={
+                    "conversation_id": conversation_id,
+                    "user_id": effective_user_id,
+                    "message_length": len(message),
+                },
+            )
 
         try:
             # Step 1: Retrieve or create user profile
-            profile = await self.profile_repo.get_or_create_default(effective_user_id)
+            profile = await self.profile_repo.get_or_create_default_cached(effective_user_id)
             profile_dict = self._profile_to_dict(profile)
             consent_tier = profile_dict.get("consent_tier", "Passive")
 
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "User profile loaded",
+                    extra={
+                        "user_id": effective_user_id,
+                        "consent_tier": consent_tier,
+                        "profile_version": profile_dict.get("profile_version"),
+                    },
+                )
+
+            # Step 2: Fetch recent conversation history for AI context
+            conversation_history = await self._get_conversation_history(profile.id)
+
+            # Step 3: Generate AI response with suggestions. The user message
+            # is persisted (Step 5) while the model is generating; both only
+            # depend on the request, and the session is used by one task only.
+            ai_task = asyncio.create_task(
+                self.ai_service.generate_response(
+                    user_message=message,
+                    profile=profile_dict,
+                    conversation_history=conversation_history,
+                    context=context,
+                )
+            )
+
+            try:
+                await self.conversation_repo.create_message(
+                    user_profile_id=profile.id,
+                    role="user",
+                    content=message,
+                    metadata=self._user_message_metadata(conversation_id, context),
+                )
+            except BaseException:
+                ai_task.cancel()
+                raise
+
+            ai_result = await ai_task
+
+            ai_response_text = ai_result.get("response", "")
+            raw_suggestions = ai_result.get("suggestions", [])
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "AI response generated",
+                    extra={
+                        "conversation_id": conversation_id,
+                        "response_length": len(ai_response_text),
+                        "raw_suggestion_count": len(raw_suggestions),
+                    },
+                )
+
+            result = await self._complete_turn(
+                conversation_id=conversation_id,
+                message=message,
+                context=context,
+                profile=profile,
+                profile_dict=profile_dict,
+                ai_response_text=ai_response_text,
+                raw_suggestions=raw_suggestions,
+            )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Chat message processed successfully",
+                    extra={
+                        "conversation_id": conversation_id,
+                        "user_id": effective_user_id,
+                        "suggestion_count": len(result["suggestions"]),
+                    },
+                )
+
+            return result
+
+        except Exception as e:
+            logger.error(
+                "Error processing chat message",
+                extra={
+                    "conversation_id": conversation_id,
+                    "user_id": effective_user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+            raise
+
+    async def process_message_stream(
+        self,
+        message: str,
+        user_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a user chat message, streaming the AI response as it arrives.
+
+        Runs the same flow as process_message, but yields response text while
+        the model generates it. Suggestion gating and persistence run once the
+        stream closes, so the client sees the first tokens after
+        time-to-first-token instead of after full generation.
+
+        Args:
+            message: The user's chat message text.
+            user_id: Optional user identifier. Defaults to DEFAULT_USER_ID
+                     for single-user MVP scope.
+            context: Optional additional context dict (mood, timestamp, etc.).
+
+        Yields:
+            {"type": "token", "delta": str} dicts carrying response text,
+            followed by one {"type": "final", ...} dict with the same keys
+            as the process_message result.
+
+        Raises:
+            Exception: Propagates exceptions from AI service or database
+                       operations after logging.
+        """
+        effective_user_id = user_id or DEFAULT_USER_ID
+        conversation_id = str(uuid.uuid4())
+
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "User profile loaded",
+                "Processing streamed chat message",
                 extra={
+                    "conversation_id": conversation_id,
                     "user_id": effective_user_id,
-                    "consent_tier": consent_tier,
-                    "profile_version": profile_dict.get("profile_version"),
+                    "message_length": len(message),
                 },
             )
 
-            # Step 2: Fetch recent conversation history for AI context
+        try:
+            profile = await self.profile_repo.get_or_create_default_cached(effective_user_id)
+            profile_dict = self._profile_to_dict(profile)
             conversation_history = await self._get_conversation_history(profile.id)
 
-            # Step 3: Generate AI response with suggestions
-            ai_result = await self.ai_service.generate_response(
+            await self.conversation_repo.create_message(
+                user_profile_id=profile.id,
+                role="user",
+                content=message,
+                metadata=self._user_message_metadata(conversation_id, context),
+            )
+
+            ai_result: Dict[str, Any] = {}
+            async for event in self.ai_service.generate_response_stream(
                 user_message=message,
                 profile=profile_dict,
                 conversation_history=conversation_history,
                 context=context,
+            ):
+                if "delta" in event:
+                    yield {"type": "token", "delta": event["delta"]}
+                else:
+                    ai_result = event
+
+            result = await self._complete_turn(
+                conversation_id=conversation_id,
+                message=message,
+                context=context,
+                profile=profile,
+                profile_dict=profile_dict,
+                ai_response_text=ai_result.get("response", ""),
+                raw_suggestions=ai_result.get("suggestions", []),
             )
 
-            ai_response_text = ai_result.get("response", "")
-            raw_suggestions = ai_result.get("suggestions", [])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Streamed chat message processed successfully",
+                    extra={
+                        "conversation_id": conversation_id,
+                        "user_id": effective_user_id,
+                        "suggestion_count": len(result["suggestions"]),
+                    },
+                )
 
-            logger.info(
-                "AI response generated",
+            yield {"type": "final", **result}
+
+        except Exception as e:
+            logger.error(
+                "Error processing streamed chat message",
                 extra={
                     "conversation_id": conversation_id,
-                    "response_length": len(ai_response_text),
-                    "raw_suggestion_count": len(raw_suggestions),
+                    "user_id": effective_user_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
                 },
             )
+            raise
 
-            # Step 3b: If no suggestions from primary response, attempt extraction
-            if not raw_suggestions and consent_tier != "Passive":
-                try:
-                    raw_suggestions = await self.ai_service.extract_suggestions(
-                        user_message=message,
-                        assistant_response=ai_response_text,
-                        profile=profile_dict,
-                    )
+    async def _complete_turn(
+        self,
+        conversation_id: str,
+        message: str,
+        context: Optional[Dict[str, Any]],
+        profile: Any,
+        profile_dict: Dict[str, Any],
+        ai_response_text: str,
+        raw_suggestions: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Gate, persist, and package a turn once the AI response is complete.
+
+        Covers the extraction fallback, ethical gating, assistant message and
+        suggestion persistence, and the profile update (Steps 3b-7), shared
+        by process_message and process_message_stream.
+
+        Args:
+            conversation_id: Identifier of this conversation turn.
+            message: The user's chat message text.
+            context: Optional additional context dict (mood, timestamp, etc.).
+            profile: The profile ORM object loaded for this turn.
+            profile_dict: Dictionary form of the profile passed to AIService.
+            ai_response_text: The conversational text of the AI response.
+            raw_suggestions: Suggestions parsed from the AI response.
+
+        Returns:
+            The process_message result dictionary.
+        """
+        consent_tier = profile_dict.get("consent_tier", "Passive")
+
+        # Step 3b: If no suggestions from primary response, attempt extraction
+        if not raw_suggestions and consent_tier != "Passive":
+            try:
+                raw_suggestions = await self.ai_service.extract_suggestions(
+                    user_message=message,
+                    assistant_response=ai_response_text,
+                    profile=profile_dict,
+                )
+                if logger.isEnabledFor(logging.INFO):
                     logger.info(
                         "Suggestions extracted via fallback",
                         extra={
@@ -176,16 +495,17 @@ class ChatService:
                             "extracted_count": len(raw_suggestions),
                         },
                     )
-                except Exception as extraction_error:
-                    logger.warning(
-                        "Suggestion extraction fallback failed",
-                        extra={
-                            "conversation_id": conversation_id,
-                            "error": str(extraction_error),
-                        },
-                    )
-                    raw_suggestions = []
+            except Exception as extraction_error:
+                logger.warning(
+                    "Suggestion extraction fallback failed",
+                    extra={
+                        "conversation_id": conversation_id,
+                        "error": str(extraction_error),
+                    },
+                )
+                raw_suggestions = []
 
+        if raw_suggestions:
             # Step 4: Gate ALL suggestions through OthelloService ethical filter
             # This is the core invariant — no suggestion reaches the user without gating
             gated_suggestions = self._gate_suggestions(
@@ -198,94 +518,106 @@ class ChatService:
                 s for s in gated_suggestions if s.get("is_permitted", False)
             ]
 
-            logger.info(
-                "Suggestions gated through Othello",
-                extra={
-                    "conversation_id": conversation_id,
-                    "total_gated": len(gated_suggestions),
-                    "permitted_count": len(permitted_suggestions),
-                    "blocked_count": len(gated_suggestions) - len(permitted_suggestions),
-                },
-            )
-
-            # Step 5: Persist conversation messages
-            # Save user message
-            message_metadata = {}
-            if context:
-                message_metadata["context"] = context
-            message_metadata["conversation_id"] = conversation_id
-
-            user_msg = await self.conversation_repo.create_message(
-                user_profile_id=profile.id,
-                role="user",
-                content=message,
-                metadata=message_metadata,
-            )
-
-            # Save assistant response
-            assistant_metadata: Dict[str, Any] = {
-                "conversation_id": conversation_id,
-                "suggestion_count": len(permitted_suggestions),
-                "total_suggestions_generated": len(raw_suggestions),
-                "suggestions_blocked": len(gated_suggestions) - len(permitted_suggestions),
-            }
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Suggestions gated through Othello",
+                    extra={
+                        "conversation_id": conversation_id,
+                        "total_gated": len(gated_suggestions),
+                        "permitted_count": len(permitted_suggestions),
+                        "blocked_count": len(gated_suggestions) - len(permitted_suggestions),
+                    },
+                )
+        else:
+            # Nothing to gate (the usual case for Passive users)
+            gated_suggestions = permitted_suggestions = []
+
+        # Step 5: Persist the assistant response (user message saved above)
+        assistant_metadata: Dict[str, Any] = {
+            "conversation_id": conversation_id,
+            "suggestion_count": len(permitted_suggestions),
+            "total_suggestions_generated": len(raw_suggestions),
+            "suggestions_blocked": len(gated_suggestions) - len(permitted_suggestions),
+        }
 
-            assistant_msg = await self.conversation_repo.create_message(
-                user_profile_id=profile.id,
-                role="assistant",
-                content=ai_response_text,
-                metadata=assistant_metadata,
-            )
+        # Added without a flush: it is inserted together with its suggestions
+        # in one unit of work, and the request commits once at the end
+        assistant_msg = self.conversation_repo.add_message(
+            user_profile_id=profile.id,
+            role="assistant",
+            content=ai_response_text,
+            metadata=assistant_metadata,
+        )
 
-            # Step 5b: Persist permitted suggestions to database
-            persisted_suggestions = await self._persist_suggestions(
+        # Step 5b: Persist permitted suggestions, already in response shape
+        response_suggestions = (
+            await self._persist_suggestions(
                 permitted_suggestions=permitted_suggestions,
                 user_profile_id=profile.id,
-                conversation_id=assistant_msg.id,
+                conversation=assistant_msg,
             )
+            if permitted_suggestions
+            else []
+        )
 
-            # Step 6: Update user profile with interaction metadata
+        # Step 6: Update user profile with interaction metadata. The response
+        # does not depend on it, so with a session factory it is buffered once
+        # the request commits and written behind in batches.
+        if self.session_factory is not None:
+            call_after_commit(
+                self.profile_repo.session,
+                partial(
+                    _buffer_interaction,
+                    self.session_factory,
+                    profile.id,
+                    self._new_interaction(message, context),
+                ),
+            )
+            profile_updated = True
+        else:
             profile_updated = await self._update_profile_from_interaction(
-                user_id=effective_user_id,
+                profile=profile,
                 message=message,
                 context=context,
             )
 
-            # Step 7: Build and return response
-            response_suggestions = self._format_suggestions_for_response(
-                persisted_suggestions
-            )
+        # Mirror this turn into the recent-history cache once the request commits
+        self.conversation_repo.record_history(
+            profile.id,
+            [
+                {"role": "user", "content": message},
+                {"role": "assistant", "content": ai_response_text},
+            ],
+        )
 
-            result: Dict[str, Any] = {
-                "conversation_id": conversation_id,
-                "message": message,
-                "response": ai_response_text,
-                "suggestions": response_suggestions,
-                "profile_updated": profile_updated,
-            }
+        # Step 7: Build and return response
+        return {
+            "conversation_id": conversation_id,
+            "message": message,
+            "response": ai_response_text,
+            "suggestions": response_suggestions,
+            "profile_updated": profile_updated,
+        }
 
-            logger.info(
-                "Chat message processed successfully",
-                extra={
-                    "conversation_id": conversation_id,
-                    "user_id": effective_user_id,
-                    "suggestion_count": len(response_suggestions),
-                },
-            )
+    @staticmethod
+    def _user_message_metadata(
+        conversation_id: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Build the metadata stored with the user's message.
 
-            return result
+        Args:
+            conversation_id: Identifier of this conversation turn.
+            context: Optional additional context dict (mood, timestamp, etc.).
 
-        except Exception as e:
-            logger.error(
-                "Error processing chat message",
-                extra={
-                    "conversation_id": conversation_id,
-                    "user_id": effective_user_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
-            )
-            raise
+        Returns:
+            Metadata dict with the conversation ID and any context.
+        """
+        message_metadata: Dict[str, Any] = {}
+        if context:
+            message_metadata["context"] = context
+        message_metadata["conversation_id"] = conversation_id
+        return message_metadata
 
     async def _get_conversation_history(
         self,
@@ -295,8 +627,9 @@ class ChatService:
         """
         Retrieve recent conversation history formatted for AI context.
 
-        Fetches the most recent messages for the user profile and formats
-        them as a list of role/content dicts suitable for the OpenAI API.
+        Reads the most recent messages for the user profile from the
+        repository's in-memory mirror, falling back to the database, as a
+        list of role/content dicts suitable for the OpenAI API.
 
         Args:
             user_profile_id: The database ID of the user profile.
@@ -307,21 +640,11 @@ class ChatService:
             ordered chronologically (oldest first).
         """
         try:
-            recent_messages = await self.conversation_repo.get_recent_by_user_profile_id(
+            return await self.conversation_repo.get_recent_history(
                 user_profile_id=user_profile_id,
                 limit=limit,
             )
 
-            history: List[Dict[str, str]] = []
-            for msg in recent_messages:
-                if msg.role in ("user", "assistant"):
-                    history.append({
-                        "role": msg.role,
-                        "content": msg.content,
-                    })
-
-            return history
-
         except Exception as e:
             logger.warning(
                 "Failed to retrieve conversation history, proceeding without context",
@@ -355,51 +678,55 @@ class ChatService:
             return []
 
         # Transform AI service suggestion format to OthelloService format
-        othello_input: List[Dict[str, Any]] = []
-        for suggestion in raw_suggestions:
-            othello_input.append({
+        othello_input: List[Dict[str, Any]] = [
+            {
                 "suggestion_text": suggestion.get("action", ""),
                 "consent_tier": suggestion.get("consent_tier"),
                 "ai_reasoning": suggestion.get("reasoning", ""),
-            })
+            }
+            for suggestion in raw_suggestions
+        ]
 
-        # Gate through OthelloService — the core ethical invariant
-        gated = self.othello_service.gate_suggestions(
+        # Gate through OthelloService — the core ethical invariant. Each gated
+        # dict carries its input's keys, so ai_reasoning travels with it.
+        return self.othello_service.gate_suggestions(
             suggestions=othello_input,
             user_consent_tier=consent_tier,
         )
 
-        # Preserve original AI reasoning alongside Othello's ethical reasoning
-        for i, gated_item in enumerate(gated):
-            if i < len(raw_suggestions):
-                ai_reasoning = raw_suggestions[i].get("reasoning", "")
-                if ai_reasoning:
-                    gated_item["ai_reasoning"] = ai_reasoning
-
-        return gated
-
     async def _persist_suggestions(
         self,
         permitted_suggestions: List[Dict[str, Any]],
         user_profile_id: int,
-        conversation_id: int,
+        conversation: Any,
     ) -> List[Dict[str, Any]]:
         """
         Persist permitted suggestions to the database.
 
         Creates suggestion records for each permitted (gated and approved)
-        suggestion, linking them to the user profile and conversation.
+        suggestion, linking them to the user profile and conversation. All
+        records are inserted in one batch, in the same flush as the pending
+        assistant message. A failed insert is not swallowed: it leaves the
+        session needing a rollback, so it propagates and the caller's
+        transaction discards the turn.
 
         Args:
             permitted_suggestions: List of suggestion dicts that passed the
                                    OthelloService ethical gate.
             user_profile_id: The database ID of the user profile.
-            conversation_id: The database ID of the assistant conversation message.
+            conversation: The assistant conversation message, possibly still
+                          pending; suggestions link to it through the
+                          relationship so both insert in the same flush.
 
         Returns:
-            List of persisted suggestion dicts with database IDs.
+            List of persisted suggestions with database IDs, formatted for
+            the API response.
+
+        Raises:
+            Exception: Propagates database errors from the batched insert.
         """
-        persisted: List[Dict[str, Any]] = []
+        rows: List[Dict[str, Any]] = []
+        verdicts: List[Any] = []
 
         for suggestion in permitted_suggestions:
             suggestion_text = suggestion.get("suggestion_text", "")
@@ -410,54 +737,66 @@ class ChatService:
             ethical_reasoning = suggestion.get("ethical_reasoning", "")
             ai_reasoning = suggestion.get("ai_reasoning", "")
 
-            # Combine ethical reasoning with AI reasoning for transparency
-            combined_reasoning = ethical_reasoning
-            if ai_reasoning:
-                combined_reasoning = (
-                    f"AI Reasoning: {ai_reasoning}\n\n"
-                    f"Ethical Assessment: {ethical_reasoning}"
-                )
+            # Combine ethical reasoning with AI reasoning for transparency;
+            # without AI reasoning the ethical text is stored as-is
+            combined_reasoning = (
+                "".join((
+                    _AI_REASONING_PREFIX,
+                    ai_reasoning,
+                    _ETHICAL_ASSESSMENT_PREFIX,
+                    ethical_reasoning,
+                ))
+                if ai_reasoning
+                else ethical_reasoning
+            )
 
-            try:
-                db_suggestion = await self.suggestion_repo.create_suggestion({
-                    "user_profile_id": user_profile_id,
-                    "conversation_id": conversation_id,
-                    "suggestion_text": suggestion_text,
-                    "consent_tier": assigned_tier,
-                    "ethical_reasoning": combined_reasoning,
-                    "status": "pending",
-                    "metadata": {
-                        "filter_reasoning": suggestion.get("filter_reasoning", ""),
-                        "user_consent_tier": suggestion.get("user_consent_tier", ""),
-                    },
-                })
-
-                persisted.append({
-                    "id": db_suggestion.id,
-                    "suggestion_text": suggestion_text,
-                    "consent_tier": assigned_tier,
-                    "ethical_reasoning": combined_reasoning,
-                    "status": "pending",
-                    "created_at": db_suggestion.created_at.isoformat()
-                    if db_suggestion.created_at
-                    else datetime.now(timezone.utc).isoformat(),
-                })
+            rows.append({
+                "user_profile_id": user_profile_id,
+                "conversation": conversation,
+                "suggestion_text": suggestion_text,
+                "consent_tier": assigned_tier,
+                "ethical_reasoning": combined_reasoning,
+                "status": "pending",
+            })
+            verdicts.append(suggestion.get("verdict"))
 
-            except Exception as e:
-                logger.error(
-                    "Failed to persist suggestion",
-                    extra={
-                        "suggestion_text": suggestion_text[:100],
-                        "error": str(e),
-                    },
-                )
-                continue
+        if not rows:
+            return []
+
+        # One batched INSERT ... RETURNING for every suggestion in the turn.
+        # It shares a flush with the pending assistant message, so a failure
+        # propagates and the request transaction rolls back the whole turn.
+        db_suggestions = await self.suggestion_repo.create_suggestions_bulk(rows)
+
+        # Rows flushed together share one fallback timestamp
+        fallback_created_at: Optional[str] = None
+        persisted: List[Dict[str, Any]] = []
+        for row, verdict, db_suggestion in zip(rows, verdicts, db_suggestions):
+            if db_suggestion.created_at:
+                created_at = db_suggestion.created_at.isoformat()
+            else:
+                if fallback_created_at is None:
+                    fallback_created_at = datetime.now(_UTC).isoformat()
+                created_at = fallback_created_at
+            persisted.append({
+                "id": db_suggestion.id,
+                "text": row["suggestion_text"],
+                "consent_tier": row["consent_tier"],
+                "reasoning": row["ethical_reasoning"],
+                # Verdicts come straight from OthelloService and are trusted,
+                # so they are converted to the schema without re-validation.
+                "ethical_reasoning": EthicalReasoning.from_verdict(verdict)
+                if verdict is not None
+                else None,
+                "status": "pending",
+                "created_at": created_at,
+            })
 
         return persisted
 
     async def _update_profile_from_interaction(
         self,
-        user_id: str,
+        profile: Any,
         message: str,
         context: Optional[Dict[str, Any]] = None,
     ) -> bool:
@@ -470,7 +809,7 @@ class ChatService:
         deferred to the full build.
 
         Args:
-            user_id: The user's unique identifier.
+            profile: The profile ORM object already loaded for this turn.
             message: The user's chat message.
             context: Optional context dict with mood, timestamp, etc.
 
@@ -478,80 +817,70 @@ class ChatService:
             Boolean indicating whether the profile was successfully updated.
         """
         try:
-            profile = await self.profile_repo.get_or_create_default(user_id)
-            
-            # Build update metadata
-            update_data: Dict[str, Any] = {}
-            
-            # Update behavioral patterns with interaction timestamp
-            behavioral_patterns = profile.behavioral_patterns or {}
-            interactions = behavioral_patterns.get("interactions", [])
-            interactions.append({
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "message_length": len(message),
-                "context": context,
-            })
-            
-            # Keep only recent interactions (last 100)
-            behavioral_patterns["interactions"] = interactions[-100:]
-            update_data["behavioral_patterns"] = behavioral_patterns
-            
-            # Update profile
-            await self.profile_repo.update(profile.id, update_data)
-            
-            return True
-            
+            return await self.profile_repo.append_interactions(
+                profile.id,
+                [self._new_interaction(message, context)],
+                MAX_TRACKED_INTERACTIONS,
+            )
+
         except Exception as e:
             logger.warning(
                 "Failed to update profile from interaction",
                 extra={
-                    "user_id": user_id,
+                    "user_id": profile.user_id,
                     "error": str(e),
                 },
             )
             return False
 
-    def _profile_to_dict(self, profile: Any) -> Dict[str, Any]:
+    @staticmethod
+    def _new_interaction(
+        message: str,
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
         """
-        Convert a profile ORM object to a dictionary.
+        Build the interaction record logged in the profile's behavioral patterns.
 
         Args:
-            profile: The profile ORM object.
+            message: The user's chat message.
+            context: Optional context dict with mood, timestamp, etc.
 
         Returns:
-            Dictionary representation of the profile.
+            The interaction record.
         """
         return {
-            "id": profile.id,
-            "user_id": profile.user_id,
-            "consent_tier": profile.consent_tier,
-            "profile_version": profile.profile_version,
-            "preferences": profile.preferences,
-            "behavioral_patterns": profile.behavioral_patterns,
-            "psychological_traits": profile.psychological_traits,
+            "timestamp": datetime.now(_UTC).isoformat(),
+            "message_length": len(message),
+            "context": context,
         }
 
-    def _format_suggestions_for_response(
-        self,
-        suggestions: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+    def _profile_to_dict(self, profile: Any) -> Dict[str, Any]:
         """
-        Format persisted suggestions for the API response.
+        Convert a profile ORM object to the dictionary AIService reads.
+
+        Only the fields used for prompting and gating are included. The
+        result is memoized on the instance per profile_version, so turns
+        served from the profile cache skip rebuilding it. The JSON fields are
+        shared by reference and must not be mutated.
 
         Args:
-            suggestions: List of persisted suggestion dicts.
+            profile: The profile ORM object.
 
         Returns:
-            List of formatted suggestion dicts for the response.
+            Dictionary representation of the profile.
         """
-        formatted = []
-        for suggestion in suggestions:
-            formatted.append({
-                "id": suggestion.get("id"),
-                "text": suggestion.get("suggestion_text"),
-                "consent_tier": suggestion.get("consent_tier"),
-                "reasoning": suggestion.get("ethical_reasoning"),
-                "status": suggestion.get("status"),
-                "created_at": suggestion.get("created_at"),
-            })
-        return formatted
+        cached = getattr(profile, "_cached_dict", None)
+        if cached is not None and cached[0] == profile.profile_version:
+            return cached[1]
+
+        profile_dict = {
+            "consent_tier": profile.consent_tier,
+            "profile_version": profile.profile_version,
+            "display_name": profile.display_name,
+            "traits": profile.traits,
+            "preferences": profile.preferences,
+            "behavioral_patterns": profile.behavioral_patterns,
+            "context_summary": profile.context_summary,
+        }
+        profile._cached_dict = (profile.profile_version, profile_dict)
+        return profile_dict
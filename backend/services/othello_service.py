@@ -16,7 +16,10 @@ Consent Tier Hierarchy (ascending intrusiveness):
 - Autonomous: Suggestions where the system would act independently (e.g., "I've already sent...")
 """
 
-from typing import Any
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Final, Iterable, Iterator
 
 from backend.schemas.suggestion import SuggestionCreate
 
@@ -29,41 +32,42 @@ CONSENT_TIER_HIERARCHY: dict[str, int] = {
     "Autonomous": 4,
 }
 
-# Keywords and patterns used for heuristic tier classification
+# Keywords and patterns used for heuristic tier classification. Within each
+# tier, keywords are listed most common first so scans stop early
 TIER_CLASSIFICATION_PATTERNS: dict[str, dict[str, Any]] = {
     "Autonomous": {
         "keywords": [
-            "i've already", "i have already", "done for you", "automatically",
-            "i went ahead", "on your behalf", "i've scheduled", "i've sent",
-            "i've booked", "i've ordered", "executed", "completed for you",
+            "i've already", "automatically", "on your behalf", "i went ahead",
+            "i've scheduled", "i've sent", "i've booked", "done for you",
+            "i have already", "i've ordered", "completed for you", "executed",
         ],
         "description": "Actions taken or to be taken autonomously by the system",
     },
     "Active": {
         "keywords": [
-            "i can", "i'll", "i will", "let me", "shall i", "want me to",
-            "i could", "would you like me to", "i'm able to", "allow me to",
-            "i'll handle", "i'll set up", "i'll arrange", "i'll create",
+            "i can", "let me", "i'll", "would you like me to", "want me to",
+            "shall i", "i could", "i will", "i'll set up", "i'll create",
+            "i'll handle", "i'll arrange", "i'm able to", "allow me to",
             "schedule for you", "send for you", "book for you",
         ],
         "description": "System offers to perform actions on behalf of the user",
     },
     "Suggestive": {
         "keywords": [
-            "try", "consider", "you should", "you could", "you might want to",
-            "recommend", "suggest", "it would help to", "a good approach",
-            "one strategy", "you may want", "it's worth", "think about",
-            "have you tried", "why not", "how about", "what if you",
-            "an option is", "you can", "a tip",
+            "try", "consider", "you can", "you could", "you might want to",
+            "you should", "recommend", "suggest", "think about", "how about",
+            "you may want", "it's worth", "a good approach", "one strategy",
+            "why not", "have you tried", "what if you", "it would help to",
+            "a tip", "an option is",
         ],
         "description": "Actionable recommendations requiring user initiative",
     },
     "Passive": {
         "keywords": [
-            "information", "note that", "keep in mind", "be aware",
-            "for your reference", "fyi", "it's common", "research shows",
-            "studies suggest", "generally", "typically", "often",
-            "some people find", "it's worth noting", "interesting fact",
+            "often", "typically", "generally", "note that", "keep in mind",
+            "research shows", "studies suggest", "some people find",
+            "it's common", "be aware", "information", "it's worth noting",
+            "for your reference", "interesting fact", "fyi",
         ],
         "description": "Information-only observations with no call to action",
     },
@@ -113,6 +117,274 @@ APPROVAL_REASONING_TEMPLATE = (
     "intrusiveness is within authorized boundaries."
 )
 
+# (suggestion tier, user tier) pairs where the suggestion is within consent
+_PERMITTED: Final[frozenset[tuple[str, str]]] = frozenset(
+    (suggestion_tier, user_tier)
+    for suggestion_tier, suggestion_level in CONSENT_TIER_HIERARCHY.items()
+    for user_tier, user_level in CONSENT_TIER_HIERARCHY.items()
+    if suggestion_level <= user_level
+)
+
+# Every (suggestion tier, user tier) pair has a fixed gate message, so all
+# 16 are formatted once at import
+_APPROVAL_CACHE: Final[dict[tuple[str, str], str]] = {
+    (suggestion_tier, user_tier): APPROVAL_REASONING_TEMPLATE.format(
+        suggestion_tier=suggestion_tier,
+        suggestion_level=suggestion_level,
+        user_tier=user_tier,
+        user_level=user_level,
+    )
+    for suggestion_tier, suggestion_level in CONSENT_TIER_HIERARCHY.items()
+    for user_tier, user_level in CONSENT_TIER_HIERARCHY.items()
+}
+_FILTER_CACHE: Final[dict[tuple[str, str], str]] = {
+    (required_tier, user_tier): FILTER_REASONING_TEMPLATE.format(
+        required_tier=required_tier,
+        required_level=required_level,
+        user_tier=user_tier,
+        user_level=user_level,
+    )
+    for required_tier, required_level in CONSENT_TIER_HIERARCHY.items()
+    for user_tier, user_level in CONSENT_TIER_HIERARCHY.items()
+}
+
+# Lowercased tier descriptions for the reasoning trigger sentence
+_TIER_DESC_LOWER: Final[dict[str, str]] = {
+    tier: patterns["description"].lower()
+    for tier, patterns in TIER_CLASSIFICATION_PATTERNS.items()
+}
+
+# Reasoning for tiers labelled by the upstream producer, which skip keyword
+# classification entirely
+_PREASSIGNED_REASONING: Final[dict[str, str]] = {
+    tier: f"{template} Classification provided by upstream producer."
+    for tier, template in ETHICAL_REASONING_TEMPLATES.items()
+}
+
+# Tiers ordered from most to least intrusive for classification
+_TIERS_BY_INTRUSIVENESS: Final[tuple[str, ...]] = (
+    "Autonomous", "Active", "Suggestive", "Passive",
+)
+
+
+def _trie_pattern(node: dict[str, Any]) -> str:
+    """
+    Render one keyword-trie node as a prefix-factored regex fragment.
+
+    Shared prefixes ("i've already", "i've sent", ...) appear once, so the
+    regex engine walks each prefix a single time instead of retrying every
+    alternative. Longer keywords are preferred over their prefixes.
+
+    Args:
+        node: Trie node mapping characters to child nodes; the "" key marks
+              the end of a keyword.
+
+    Returns:
+        Regex fragment matching every keyword below this node.
+    """
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in node.items()
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if "" in node else group
+
+
+def _compile_keywords(keywords: Iterable[str]) -> re.Pattern[str]:
+    """
+    Compile keywords into one regex built from a character trie.
+
+    Args:
+        keywords: Keywords to match (lowercased before insertion).
+
+    Returns:
+        Compiled pattern matching any of the keywords.
+    """
+    trie: dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return re.compile(_trie_pattern(trie))
+
+
+# One precompiled trie regex per tier, most intrusive first; used for
+# classification and for pre-assigned tier lookups
+_TIER_REGEXES: Final[dict[str, re.Pattern[str]]] = {
+    tier: _compile_keywords(TIER_CLASSIFICATION_PATTERNS[tier]["keywords"])
+    for tier in _TIERS_BY_INTRUSIVENESS
+}
+
+# Single-word keywords per tier, checked by set lookup against the text's
+# tokens before falling back to the tier's regex
+_TIER_WORDS: Final[dict[str, frozenset[str]]] = {
+    tier: frozenset(
+        keyword.lower()
+        for keyword in TIER_CLASSIFICATION_PATTERNS[tier]["keywords"]
+        if " " not in keyword
+    )
+    for tier in _TIERS_BY_INTRUSIVENESS
+}
+_TOKEN_RE: Final = re.compile(r"[a-z']+")
+
+# Text shorter than every keyword cannot match and skips scanning
+_MIN_KEYWORD_LEN: Final = min(
+    len(keyword)
+    for patterns in TIER_CLASSIFICATION_PATTERNS.values()
+    for keyword in patterns["keywords"]
+)
+
+
+def _classify_with_trigger(text_lower: str) -> tuple[str, str | None]:
+    """
+    Classify normalized suggestion text and report the triggering keyword.
+
+    Args:
+        text_lower: Lowercased, whitespace-collapsed suggestion text.
+
+    Returns:
+        Tuple of (tier, matched keyword), with keyword None when the
+        'Suggestive' default was applied.
+    """
+    if len(text_lower) < _MIN_KEYWORD_LEN:
+        return "Suggestive", None
+
+    # Whole-word hits resolve via hashing, reporting the leftmost one; the
+    # regex still runs on a miss so inflected forms ("recommended") and
+    # phrases keep matching as substrings
+    tokens = _TOKEN_RE.findall(text_lower)
+    for tier, pattern in _TIER_REGEXES.items():
+        words = _TIER_WORDS[tier]
+        for token in tokens:
+            if token in words:
+                return tier, token
+        match = pattern.search(text_lower)
+        if match is not None:
+            return tier, match.group(0)
+
+    return "Suggestive", None
+
+
+def _normalize(suggestion_text: str) -> str:
+    """Lowercase text and collapse whitespace so equivalent suggestions share a cache key."""
+    return " ".join(suggestion_text.lower().split())
+
+
+@lru_cache(maxsize=2048)
+def _classify_cached(text_lower: str) -> tuple[str, str | None]:
+    """Classify normalized text, memoized for repeated suggestions."""
+    return _classify_with_trigger(text_lower)
+
+
+@lru_cache(maxsize=2048)
+def _reasoning_cached(assigned_tier: str, matched_keyword: str | None) -> str:
+    """
+    Format ethical reasoning for a tier and its (optional) trigger keyword.
+
+    Memoized per (tier, keyword); only a few hundred combinations exist.
+    """
+    base_reasoning = ETHICAL_REASONING_TEMPLATES.get(
+        assigned_tier,
+        ETHICAL_REASONING_TEMPLATES["Suggestive"],
+    )
+
+    if matched_keyword and assigned_tier in _TIER_DESC_LOWER:
+        return (
+            f"{base_reasoning} Classification trigger: detected "
+            f"'{matched_keyword}' pattern indicating "
+            f"{_TIER_DESC_LOWER[assigned_tier]}."
+        )
+
+    return (
+        f"{base_reasoning} Classification based on default heuristic — "
+        f"no strong tier-specific indicators detected."
+    )
+
+
+# Reasoning for empty or whitespace-only suggestions, which gate as Passive
+_EMPTY_REASONING: Final = _reasoning_cached("Passive", None)
+
+
+def _find_tier_keyword(text_lower: str, tier: str) -> str | None:
+    """
+    Find the leftmost keyword of one tier present in normalized text.
+
+    Used when a tier was assigned upstream rather than classified here.
+
+    Args:
+        text_lower: Lowercased, whitespace-collapsed suggestion text.
+        tier: The consent tier whose keywords are checked.
+
+    Returns:
+        The matched keyword, or None if none of the tier's keywords occur.
+    """
+    pattern = _TIER_REGEXES.get(tier)
+    if pattern is None:
+        return None
+    match = pattern.search(text_lower)
+    return match.group(0) if match is not None else None
+
+
+@dataclass(slots=True)
+class EthicalVerdict:
+    """
+    Internal, trusted record of Othello's assessment for one suggestion.
+
+    Passed between the gate and response assembly without validation;
+    converted to the EthicalReasoning schema only at the API boundary.
+    """
+
+    passed: bool
+    justification: str
+    flags: tuple[str, ...] = ()
+    confidence: float = 0.5
+
+
+@dataclass(slots=True)
+class GateResult:
+    """
+    Internal outcome of gating one suggestion.
+
+    Kept as a slotted record while gating so blocked results can be dropped
+    cheaply; converted to the public result dict only at the service boundary.
+    """
+
+    suggestion_text: str
+    assigned_tier: str
+    ethical_reasoning: str
+    is_permitted: bool
+    user_consent_tier: str
+    filter_reasoning: str
+
+    def as_dict(self, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Build the public gating result dict, including its EthicalVerdict.
+
+        Keys from metadata are carried over in the same dict literal; the
+        gating keys always win over identically named metadata keys.
+        """
+        is_permitted = self.is_permitted
+        return {
+            **(metadata or {}),
+            "suggestion_text": self.suggestion_text,
+            "assigned_tier": self.assigned_tier,
+            "ethical_reasoning": self.ethical_reasoning,
+            "is_permitted": is_permitted,
+            "user_consent_tier": self.user_consent_tier,
+            "verdict": EthicalVerdict(
+                passed=is_permitted,
+                justification=self.ethical_reasoning,
+                flags=() if is_permitted else ("exceeds_consent_tier",),
+            ),
+            "filter_reasoning": self.filter_reasoning,
+        }
+
 
 class OthelloService:
     """
@@ -124,21 +396,19 @@ class OthelloService:
     - Every suggestion has transparent ethical reasoning
     - No suggestion exceeds the user's authorized consent level
     - All gating decisions are auditable and explainable
-    """
 
-    def __init__(self) -> None:
-        """Initialize OthelloService with classification patterns."""
-        self._tier_hierarchy = CONSENT_TIER_HIERARCHY
-        self._classification_patterns = TIER_CLASSIFICATION_PATTERNS
-        self._reasoning_templates = ETHICAL_REASONING_TEMPLATES
+    The service is stateless: tiers, keywords, and templates are read
+    directly from the module-level constants.
+    """
 
-    def classify_suggestion_tier(self, suggestion_text: str) -> str:
+    @staticmethod
+    def classify_suggestion_tier(suggestion_text: str) -> str:
         """
         Classify a suggestion's consent tier based on its content.
 
         Uses keyword-based heuristic analysis to determine the intrusiveness
-        level of a suggestion. Checks tiers from most to least intrusive,
-        returning the first match. Defaults to 'Suggestive' if no clear
+        level of a suggestion. All tier keywords are matched in one pass and
+        the most intrusive hit wins. Defaults to 'Suggestive' if no clear
         classification can be made (safe middle ground).
 
         Args:
@@ -147,26 +417,22 @@ class OthelloService:
         Returns:
             The consent tier string: 'Passive', 'Suggestive', 'Active', or 'Autonomous'.
         """
-        text_lower = suggestion_text.lower().strip()
+        text_lower = _normalize(suggestion_text)
 
         if not text_lower:
             return "Passive"
 
-        # Check tiers from most intrusive to least intrusive
-        # This ensures that if a suggestion matches multiple tiers,
-        # it gets classified at the highest (most restrictive) level
-        for tier in ["Autonomous", "Active", "Suggestive", "Passive"]:
-            patterns = self._classification_patterns[tier]
-            for keyword in patterns["keywords"]:
-                if keyword.lower() in text_lower:
-                    return tier
-
-        # Default to Suggestive — a safe middle ground that requires
-        # at least Suggestive consent but doesn't over-restrict
-        return "Suggestive"
+        # If a suggestion matches multiple tiers it gets classified at the
+        # highest (most restrictive) level. Unmatched text defaults to
+        # Suggestive — a safe middle ground that requires at least
+        # Suggestive consent but doesn't over-restrict
+        return _classify_cached(text_lower)[0]
 
+    @staticmethod
     def generate_ethical_reasoning(
-        self, suggestion_text: str, assigned_tier: str
+        suggestion_text: str,
+        assigned_tier: str,
+        matched_keyword: str | None = None,
     ) -> str:
         """
         Generate transparent ethical reasoning for a suggestion's tier classification.
@@ -178,45 +444,27 @@ class OthelloService:
         Args:
             suggestion_text: The text content of the suggestion.
             assigned_tier: The consent tier assigned to the suggestion.
+            matched_keyword: Keyword that triggered the classification, if
+                             already known. When omitted the text is scanned
+                             for one of the assigned tier's keywords.
 
         Returns:
             A string containing the ethical reasoning justification.
         """
-        base_reasoning = self._reasoning_templates.get(
-            assigned_tier,
-            self._reasoning_templates["Suggestive"],
-        )
-
-        # Identify which keyword triggered the classification
-        text_lower = suggestion_text.lower().strip()
-        matched_keyword = None
-
-        if assigned_tier in self._classification_patterns:
-            for keyword in self._classification_patterns[assigned_tier]["keywords"]:
-                if keyword.lower() in text_lower:
-                    matched_keyword = keyword
-                    break
-
-        if matched_keyword:
-            reasoning = (
-                f"{base_reasoning} Classification trigger: detected "
-                f"'{matched_keyword}' pattern indicating "
-                f"{self._classification_patterns[assigned_tier]['description'].lower()}."
-            )
-        else:
-            reasoning = (
-                f"{base_reasoning} Classification based on default heuristic — "
-                f"no strong tier-specific indicators detected."
+        if matched_keyword is None:
+            matched_keyword = _find_tier_keyword(
+                _normalize(suggestion_text), assigned_tier
             )
+        return _reasoning_cached(assigned_tier, matched_keyword)
 
-        return reasoning
-
-    def is_tier_permitted(self, suggestion_tier: str, user_consent_tier: str) -> bool:
+    @staticmethod
+    def is_tier_permitted(suggestion_tier: str, user_consent_tier: str) -> bool:
         """
         Check if a suggestion's tier is within the user's authorized consent level.
 
         A suggestion is permitted if its intrusiveness level (tier number) is
-        less than or equal to the user's consent tier level.
+        less than or equal to the user's consent tier level. Unknown tiers
+        are never permitted.
 
         Args:
             suggestion_tier: The consent tier of the suggestion.
@@ -225,9 +473,7 @@ class OthelloService:
         Returns:
             True if the suggestion is permitted, False otherwise.
         """
-        suggestion_level = self._tier_hierarchy.get(suggestion_tier, 0)
-        user_level = self._tier_hierarchy.get(user_consent_tier, 0)
-        return suggestion_level <= user_level
+        return (suggestion_tier, user_consent_tier) in _PERMITTED
 
     def gate_suggestion(
         self,
@@ -257,57 +503,93 @@ class OthelloService:
                 - is_permitted: Whether the suggestion passed the consent gate
                 - filter_reasoning: If blocked, explanation of why it was filtered
                 - user_consent_tier: The user's current consent tier for reference
+                - verdict: EthicalVerdict summarizing the gating decision
         """
-        # Step 1: Classify tier
-        assigned_tier = pre_assigned_tier or self.classify_suggestion_tier(
-            suggestion_text
-        )
-
-        # Validate tier value
-        if assigned_tier not in self._tier_hierarchy:
-            assigned_tier = "Suggestive"
+        user_level = CONSENT_TIER_HIERARCHY.get(user_consent_tier)
+        if user_level is None:
+            user_consent_tier, user_level = "Passive", CONSENT_TIER_HIERARCHY["Passive"]
+
+        # Unlabelled blank text (e.g. flaky LLM output) classifies as Passive;
+        # skip the pipeline. A pre-assigned tier is still gated as usual.
+        if pre_assigned_tier is None and (
+            not suggestion_text or suggestion_text.isspace()
+        ):
+            return GateResult(
+                suggestion_text=suggestion_text,
+                assigned_tier="Passive",
+                ethical_reasoning=_EMPTY_REASONING,
+                is_permitted=True,
+                user_consent_tier=user_consent_tier,
+                filter_reasoning=_APPROVAL_CACHE[("Passive", user_consent_tier)],
+            ).as_dict()
 
-        # Validate user consent tier value
-        if user_consent_tier not in self._tier_hierarchy:
-            user_consent_tier = "Passive"
+        return self._gate_suggestion_normalized(
+            suggestion_text,
+            _normalize(suggestion_text),
+            user_consent_tier,
+            user_level,
+            pre_assigned_tier,
+        ).as_dict()
 
-        # Step 2: Generate ethical reasoning for classification
-        ethical_reasoning = self.generate_ethical_reasoning(
-            suggestion_text, assigned_tier
-        )
+    @staticmethod
+    def _gate_suggestion_normalized(
+        suggestion_text: str,
+        text_lower: str,
+        user_consent_tier: str,
+        user_level: int,
+        pre_assigned_tier: str | None,
+    ) -> GateResult:
+        """
+        Gate one suggestion against an already-validated user consent tier.
 
-        # Step 3: Check consent boundary
-        is_permitted = self.is_tier_permitted(assigned_tier, user_consent_tier)
+        Shared by gate_suggestion and the batch path so the user tier is
+        validated and resolved to its level once per batch, and the text is
+        normalized exactly once per suggestion.
 
-        # Step 4: Build result
-        result: dict[str, Any] = {
-            "suggestion_text": suggestion_text,
-            "assigned_tier": assigned_tier,
-            "ethical_reasoning": ethical_reasoning,
-            "is_permitted": is_permitted,
-            "user_consent_tier": user_consent_tier,
-        }
+        Args:
+            suggestion_text: The text content of the suggestion.
+            text_lower: suggestion_text already passed through _normalize.
+            user_consent_tier: The user's validated consent tier.
+            user_level: Numeric level of user_consent_tier.
+            pre_assigned_tier: Optional pre-assigned tier (skips classification
+                               and keyword scanning).
 
-        if is_permitted:
-            suggestion_level = self._tier_hierarchy[assigned_tier]
-            user_level = self._tier_hierarchy[user_consent_tier]
-            result["filter_reasoning"] = APPROVAL_REASONING_TEMPLATE.format(
-                suggestion_tier=assigned_tier,
-                suggestion_level=suggestion_level,
-                user_tier=user_consent_tier,
-                user_level=user_level,
-            )
+        Returns:
+            GateResult for the suggestion.
+        """
+        # Steps 1-2: Resolve the tier and its reasoning. Upstream tier labels
+        # are trusted without scanning; otherwise classify here and cite the
+        # trigger keyword
+        if pre_assigned_tier:
+            assigned_tier = pre_assigned_tier
+            ethical_reasoning = _PREASSIGNED_REASONING.get(assigned_tier)
         else:
-            required_level = self._tier_hierarchy[assigned_tier]
-            user_level = self._tier_hierarchy[user_consent_tier]
-            result["filter_reasoning"] = FILTER_REASONING_TEMPLATE.format(
-                required_tier=assigned_tier,
-                required_level=required_level,
-                user_tier=user_consent_tier,
-                user_level=user_level,
-            )
+            if text_lower:
+                assigned_tier, matched_keyword = _classify_cached(text_lower)
+            else:
+                assigned_tier, matched_keyword = "Passive", None
+            ethical_reasoning = _reasoning_cached(assigned_tier, matched_keyword)
 
-        return result
+        # Validate tier value
+        suggestion_level = CONSENT_TIER_HIERARCHY.get(assigned_tier)
+        if suggestion_level is None:
+            assigned_tier = "Suggestive"
+            suggestion_level = CONSENT_TIER_HIERARCHY["Suggestive"]
+            ethical_reasoning = _reasoning_cached(assigned_tier, None)
+
+        # Step 3: Check consent boundary
+        is_permitted = suggestion_level <= user_level
+
+        # Step 4: Build result
+        reasoning_cache = _APPROVAL_CACHE if is_permitted else _FILTER_CACHE
+        return GateResult(
+            suggestion_text=suggestion_text,
+            assigned_tier=assigned_tier,
+            ethical_reasoning=ethical_reasoning,
+            is_permitted=is_permitted,
+            user_consent_tier=user_consent_tier,
+            filter_reasoning=reasoning_cache[(assigned_tier, user_consent_tier)],
+        )
 
     def gate_suggestions(
         self,
@@ -329,29 +611,53 @@ class OthelloService:
         Returns:
             List of gated suggestion dicts with full ethical metadata.
         """
-        gated_results: list[dict[str, Any]] = []
+        return list(self._iter_gate(suggestions, user_consent_tier))
+
+    def _iter_gate(
+        self,
+        suggestions: Iterable[dict[str, Any]],
+        user_consent_tier: str,
+        permitted_only: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily gate suggestions, yielding each result as it is produced.
+
+        Lets callers filter or collect in the same pass without materializing
+        the full gated batch first.
+
+        Args:
+            suggestions: Suggestion dicts as accepted by gate_suggestions.
+            user_consent_tier: The user's current consent tier setting.
+            permitted_only: Skip blocked suggestions before building their
+                            result dicts.
+
+        Yields:
+            Gated suggestion dicts with full ethical metadata.
+        """
+        # Resolve the user's tier once for the whole batch
+        user_level = CONSENT_TIER_HIERARCHY.get(user_consent_tier)
+        if user_level is None:
+            user_consent_tier, user_level = "Passive", CONSENT_TIER_HIERARCHY["Passive"]
+        gate = self._gate_suggestion_normalized
 
         for suggestion in suggestions:
             suggestion_text = suggestion.get("suggestion_text", "")
-            pre_assigned_tier = suggestion.get("consent_tier")
+            text_lower = _normalize(suggestion_text) if suggestion_text else ""
 
-            if not suggestion_text:
+            if not text_lower:
                 continue
 
-            gated = self.gate_suggestion(
-                suggestion_text=suggestion_text,
-                user_consent_tier=user_consent_tier,
-                pre_assigned_tier=pre_assigned_tier,
+            result = gate(
+                suggestion_text,
+                text_lower,
+                user_consent_tier,
+                user_level,
+                suggestion.get("consent_tier"),
             )
-
+            if permitted_only and not result.is_permitted:
+                continue
             # Preserve any additional metadata from the original suggestion
-            for key, value in suggestion.items():
-                if key not in gated:
-                    gated[key] = value
-
-            gated_results.append(gated)
-
-        return gated_results
+            yield result.as_dict(suggestion)
 
     def filter_permitted_suggestions(
         self,
@@ -372,8 +678,9 @@ class OthelloService:
         Returns:
             List of only the permitted suggestion dicts with ethical metadata.
         """
-        all_gated = self.gate_suggestions(suggestions, user_consent_tier)
-        return [s for s in all_gated if s.get("is_permitted", False)]
+        return list(
+            self._iter_gate(suggestions, user_consent_tier, permitted_only=True)
+        )
 
     def build_suggestion_create(
         self,
@@ -18,10 +18,12 @@ Services MUST NOT import from api layer, FastAPI Request/Response objects,
 or raw SQL.
 """
 
+import heapq
 import logging
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from backend.repositories.profile_repository import ProfileRepository
+from backend.repositories.profile_repository import MERGE_FIELDS, ProfileRepository
 from backend.models.user_profile import UserProfile
 
 
@@ -31,7 +33,20 @@ logger = logging.getLogger(__name__)
 DEFAULT_USER_ID = "default_user"
 
 # Valid consent tiers in order of increasing autonomy
-CONSENT_TIERS = ["Passive", "Suggestive", "Active", "Autonomous"]
+CONSENT_TIERS: tuple[str, ...] = ("Passive", "Suggestive", "Active", "Autonomous")
+_CONSENT_TIERS_SET = frozenset(CONSENT_TIERS)
+_CONSENT_TIERS_MSG = ", ".join(CONSENT_TIERS)
+
+# Fields accepted by update_profile
+_SUPPORTED_UPDATE_FIELDS = frozenset({
+    "display_name",
+    "consent_tier",
+    "traits",
+    "preferences",
+    "behavioral_patterns",
+    "context_summary",
+})
+_SUPPORTED_UPDATE_FIELDS_MSG = ", ".join(sorted(_SUPPORTED_UPDATE_FIELDS))
 
 # Consent tier descriptions for user-facing display
 CONSENT_TIER_DESCRIPTIONS: Dict[str, str] = {
@@ -42,6 +57,29 @@ CONSENT_TIER_DESCRIPTIONS: Dict[str, str] = {
 }
 
 
+# user_id -> ((profile_version, updated_at), summary dict). Versions bump on
+# every service write and updated_at on every row write, so a stale entry
+# never matches and no explicit invalidation is needed.
+_SUMMARY_CACHE: Dict[str, Tuple[Tuple[int, Optional[datetime]], Dict[str, Any]]] = {}
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp as ISO 8601, passing None through."""
+    return value.isoformat() if value is not None else None
+
+
+def _trait_sort_key(item: Tuple[str, Any]) -> Any:
+    """
+    Rank a (name, value) trait by its value; non-numeric values rank as 0.
+
+    Traits mix 0.0-1.0 scores with string labels such as risk_tolerance and
+    decision_style, so a bare itemgetter(1) would compare str with float.
+    heapq.nlargest calls this once per item, not per comparison.
+    """
+    value = item[1]
+    return value if isinstance(value, (int, float)) else 0
+
+
 class ProfileService:
     """
     Service for user profile management and consent tier operations.
@@ -71,6 +109,10 @@ class ProfileService:
         self.profile_repository = profile_repository
         self.default_user_id = default_user_id
 
+    def _resolve(self, user_id: Optional[str]) -> str:
+        """Return user_id, falling back to the configured default_user_id."""
+        return user_id or self.default_user_id
+
     async def get_profile(self, user_id: Optional[str] = None) -> UserProfile:
         """
         Retrieve the user profile, creating a default one if it doesn't exist.
@@ -78,6 +120,8 @@ class ProfileService:
         This is the primary entry point for profile retrieval. For the
         single-user MVP, it uses the default_user_id if no user_id is provided.
         Guarantees a profile always exists via the get-or-create pattern.
+        Reads are served from the repository's short-TTL profile cache,
+        which every profile write evicts.
 
         Args:
             user_id: Optional user identifier. Defaults to the configured
@@ -86,19 +130,21 @@ class ProfileService:
         Returns:
             The UserProfile instance for the requested user.
         """
-        resolved_user_id = user_id or self.default_user_id
-        logger.info("Retrieving profile for user_id=%s", resolved_user_id)
+        resolved_user_id = self._resolve(user_id)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Retrieving profile for user_id=%s", resolved_user_id)
 
-        profile = await self.profile_repository.get_or_create_default(
+        profile = await self.profile_repository.get_or_create_default_cached(
             user_id=resolved_user_id
         )
 
-        logger.info(
-            "Profile retrieved: user_id=%s, version=%d, consent_tier=%s",
-            profile.user_id,
-            profile.profile_version,
-            profile.consent_tier,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Profile retrieved: user_id=%s, version=%d, consent_tier=%s",
+                profile.user_id,
+                profile.profile_version,
+                profile.consent_tier,
+            )
         return profile
 
     async def get_profile_summary(
@@ -109,7 +155,8 @@ class ProfileService:
 
         Returns a dictionary with the profile data structured for the
         frontend display, including top traits, current consent tier,
-        and profile metadata.
+        and profile metadata. Summaries are memoized per profile version;
+        callers must treat the returned dict as read-only.
 
         Args:
             user_id: Optional user identifier. Defaults to the configured
@@ -131,7 +178,15 @@ class ProfileService:
                 - updated_at: Last update timestamp (ISO format)
         """
         profile = await self.get_profile(user_id)
-        return self._format_profile_summary(profile)
+
+        version = (profile.profile_version, profile.updated_at)
+        cached = _SUMMARY_CACHE.get(profile.user_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        summary = self._format_profile_summary(profile)
+        _SUMMARY_CACHE[profile.user_id] = (version, summary)
+        return summary
 
     async def update_consent_tier(
         self, consent_tier: str, user_id: Optional[str] = None
@@ -154,44 +209,36 @@ class ProfileService:
 
         Raises:
             ValueError: If consent_tier is not a valid tier value.
-            RuntimeError: If the profile could not be found or updated.
         """
-        resolved_user_id = user_id or self.default_user_id
+        resolved_user_id = self._resolve(user_id)
 
         # Validate consent tier
-        if consent_tier not in CONSENT_TIERS:
+        if consent_tier not in _CONSENT_TIERS_SET:
             raise ValueError(
                 f"Invalid consent tier '{consent_tier}'. "
-                f"Must be one of: {', '.join(CONSENT_TIERS)}"
+                f"Must be one of: {_CONSENT_TIERS_MSG}"
             )
 
-        # Ensure profile exists before updating
-        await self.get_profile(resolved_user_id)
-
-        logger.info(
-            "Updating consent tier for user_id=%s to '%s'",
-            resolved_user_id,
-            consent_tier,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating consent tier for user_id=%s to '%s'",
+                resolved_user_id,
+                consent_tier,
+            )
 
         updated_profile = await self.profile_repository.update_consent_tier(
             user_id=resolved_user_id,
             consent_tier=consent_tier,
         )
 
-        if updated_profile is None:
-            raise RuntimeError(
-                f"Failed to update consent tier for user_id '{resolved_user_id}'. "
-                "Profile not found after existence check."
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Consent tier updated: user_id=%s, tier=%s, version=%d",
+                updated_profile.user_id,
+                updated_profile.consent_tier,
+                updated_profile.profile_version,
             )
 
-        logger.info(
-            "Consent tier updated: user_id=%s, tier=%s, version=%d",
-            updated_profile.user_id,
-            updated_profile.consent_tier,
-            updated_profile.profile_version,
-        )
-
         return updated_profile
 
     async def update_profile(
@@ -220,90 +267,66 @@ class ProfileService:
         Raises:
             ValueError: If consent_tier is included but invalid, or if
                         unsupported fields are provided.
+            TypeError: If traits, preferences, or behavioral_patterns is
+                       included but is neither a dict nor None. None-valued
+                       merge fields are ignored.
         """
-        resolved_user_id = user_id or self.default_user_id
+        resolved_user_id = self._resolve(user_id)
 
         # Validate consent tier if present
         if "consent_tier" in updates:
-            if updates["consent_tier"] not in CONSENT_TIERS:
+            if updates["consent_tier"] not in _CONSENT_TIERS_SET:
                 raise ValueError(
                     f"Invalid consent tier '{updates['consent_tier']}'. "
-                    f"Must be one of: {', '.join(CONSENT_TIERS)}"
+                    f"Must be one of: {_CONSENT_TIERS_MSG}"
                 )
 
         # Validate that only supported fields are being updated
-        supported_fields = {
-            "display_name",
-            "consent_tier",
-            "traits",
-            "preferences",
-            "behavioral_patterns",
-            "context_summary",
-        }
-        unsupported = set(updates.keys()) - supported_fields
+        unsupported = updates.keys() - _SUPPORTED_UPDATE_FIELDS
         if unsupported:
             raise ValueError(
                 f"Unsupported profile fields: {', '.join(sorted(unsupported))}. "
-                f"Supported fields: {', '.join(sorted(supported_fields))}"
-            )
-
-        logger.info(
-            "Updating profile for user_id=%s, fields=%s",
-            resolved_user_id,
-            list(updates.keys()),
-        )
-
-        # Handle merge-based fields separately
-        profile = await self.get_profile(resolved_user_id)
-
-        if "traits" in updates and isinstance(updates["traits"], dict):
-            await self.profile_repository.update_traits(
-                user_id=resolved_user_id,
-                traits=updates["traits"],
+                f"Supported fields: {_SUPPORTED_UPDATE_FIELDS_MSG}"
             )
 
-        if "preferences" in updates and isinstance(updates["preferences"], dict):
-            await self.profile_repository.update_preferences(
-                user_id=resolved_user_id,
-                preferences=updates["preferences"],
-            )
-
-        if "behavioral_patterns" in updates and isinstance(
-            updates["behavioral_patterns"], dict
-        ):
-            await self.profile_repository.update_behavioral_patterns(
-                user_id=resolved_user_id,
-                behavioral_patterns=updates["behavioral_patterns"],
-            )
-
-        if "context_summary" in updates:
-            await self.profile_repository.update_context_summary(
-                user_id=resolved_user_id,
-                context_summary=updates["context_summary"],
+        # Merge fields must be dicts; None means "leave unchanged"
+        skipped = []
+        for field in MERGE_FIELDS:
+            value = updates.get(field)
+            if value is None:
+                if field in updates:
+                    skipped.append(field)
+            elif not isinstance(value, dict):
+                raise TypeError(
+                    f"{field} must be a dict, got {type(value).__name__}"
+                )
+        if skipped:
+            updates = {
+                field: value
+                for field, value in updates.items()
+                if field not in skipped
+            }
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating profile for user_id=%s, fields=%s",
+                resolved_user_id,
+                tuple(updates),
             )
 
-        # Handle direct field updates (display_name, consent_tier)
-        direct_updates: Dict[str, Any] = {}
-        if "display_name" in updates:
-            direct_updates["display_name"] = updates["display_name"]
-        if "consent_tier" in updates:
-            direct_updates["consent_tier"] = updates["consent_tier"]
+        # Apply every field in one repository call
+        updated_profile = await self.profile_repository.apply_updates(
+            user_id=resolved_user_id,
+            data=updates,
+        )
 
-        if direct_updates:
-            await self.profile_repository.upsert(
-                user_id=resolved_user_id,
-                data=direct_updates,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Profile updated: user_id=%s, version=%d",
+                updated_profile.user_id,
+                updated_profile.profile_version,
             )
 
-        # Re-fetch the fully updated profile
-        updated_profile = await self.get_profile(resolved_user_id)
-
-        logger.info(
-            "Profile updated: user_id=%s, version=%d",
-            updated_profile.user_id,
-            updated_profile.profile_version,
-        )
-
         return updated_profile
 
     async def update_traits(
@@ -326,38 +349,28 @@ class ProfileService:
 
         Returns:
             The updated UserProfile instance.
-
-        Raises:
-            RuntimeError: If the profile could not be found or updated.
         """
-        resolved_user_id = user_id or self.default_user_id
+        resolved_user_id = self._resolve(user_id)
 
-        # Ensure profile exists
-        await self.get_profile(resolved_user_id)
-
-        logger.info(
-            "Updating traits for user_id=%s, keys=%s",
-            resolved_user_id,
-            list(traits.keys()),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating traits for user_id=%s, keys=%s",
+                resolved_user_id,
+                tuple(traits),
+            )
 
         updated_profile = await self.profile_repository.update_traits(
             user_id=resolved_user_id,
             traits=traits,
         )
 
-        if updated_profile is None:
-            raise RuntimeError(
-                f"Failed to update traits for user_id '{resolved_user_id}'. "
-                "Profile not found after existence check."
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Traits updated: user_id=%s, version=%d",
+                updated_profile.user_id,
+                updated_profile.profile_version,
             )
 
-        logger.info(
-            "Traits updated: user_id=%s, version=%d",
-            updated_profile.user_id,
-            updated_profile.profile_version,
-        )
-
         return updated_profile
 
     async def update_preferences(
@@ -380,38 +393,28 @@ class ProfileService:
 
         Returns:
             The updated UserProfile instance.
-
-        Raises:
-            RuntimeError: If the profile could not be found or updated.
         """
-        resolved_user_id = user_id or self.default_user_id
-
-        # Ensure profile exists
-        await self.get_profile(resolved_user_id)
+        resolved_user_id = self._resolve(user_id)
 
-        logger.info(
-            "Updating preferences for user_id=%s, keys=%s",
-            resolved_user_id,
-            list(preferences.keys()),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating preferences for user_id=%s, keys=%s",
+                resolved_user_id,
+                tuple(preferences),
+            )
 
         updated_profile = await self.profile_repository.update_preferences(
             user_id=resolved_user_id,
             preferences=preferences,
         )
 
-        if updated_profile is None:
-            raise RuntimeError(
-                f"Failed to update preferences for user_id '{resolved_user_id}'. "
-                "Profile not found after existence check."
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Preferences updated: user_id=%s, version=%d",
+                updated_profile.user_id,
+                updated_profile.profile_version,
             )
 
-        logger.info(
-            "Preferences updated: user_id=%s, version=%d",
-            updated_profile.user_id,
-            updated_profile.profile_version,
-        )
-
         return updated_profile
 
     async def update_behavioral_patterns(
@@ -434,38 +437,28 @@ class ProfileService:
 
         Returns:
             The updated UserProfile instance.
-
-        Raises:
-            RuntimeError: If the profile could not be found or updated.
         """
-        resolved_user_id = user_id or self.default_user_id
+        resolved_user_id = self._resolve(user_id)
 
-        # Ensure profile exists
-        await self.get_profile(resolved_user_id)
-
-        logger.info(
-            "Updating behavioral patterns for user_id=%s, keys=%s",
-            resolved_user_id,
-            list(behavioral_patterns.keys()),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating behavioral patterns for user_id=%s, keys=%s",
+                resolved_user_id,
+                tuple(behavioral_patterns),
+            )
 
         updated_profile = await self.profile_repository.update_behavioral_patterns(
             user_id=resolved_user_id,
             behavioral_patterns=behavioral_patterns,
         )
 
-        if updated_profile is None:
-            raise RuntimeError(
-                f"Failed to update behavioral patterns for user_id '{resolved_user_id}'. "
-                "Profile not found after existence check."
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Behavioral patterns updated: user_id=%s, version=%d",
+                updated_profile.user_id,
+                updated_profile.profile_version,
             )
 
-        logger.info(
-            "Behavioral patterns updated: user_id=%s, version=%d",
-            updated_profile.user_id,
-            updated_profile.profile_version,
-        )
-
         return updated_profile
 
     async def update_context_summary(
@@ -487,37 +480,27 @@ class ProfileService:
 
         Returns:
             The updated UserProfile instance.
-
-        Raises:
-            RuntimeError: If the profile could not be found or updated.
         """
-        resolved_user_id = user_id or self.default_user_id
-
-        # Ensure profile exists
-        await self.get_profile(resolved_user_id)
+        resolved_user_id = self._resolve(user_id)
 
-        logger.info(
-            "Updating context summary for user_id=%s",
-            resolved_user_id,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updating context summary for user_id=%s",
+                resolved_user_id,
+            )
 
         updated_profile = await self.profile_repository.update_context_summary(
             user_id=resolved_user_id,
             context_summary=context_summary,
         )
 
-        if updated_profile is None:
-            raise RuntimeError(
-                f"Failed to update context summary for user_id '{resolved_user_id}'. "
-                "Profile not found after existence check."
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Context summary updated: user_id=%s, version=%d",
+                updated_profile.user_id,
+                updated_profile.profile_version,
             )
 
-        logger.info(
-            "Context summary updated: user_id=%s, version=%d",
-            updated_profile.user_id,
-            updated_profile.profile_version,
-        )
-
         return updated_profile
 
     def _format_profile_summary(self, profile: UserProfile) -> Dict[str, Any]:
@@ -533,14 +516,11 @@ class ProfileService:
         # Extract top 3 traits by value
         top_traits = []
         if profile.traits:
-            sorted_traits = sorted(
-                profile.traits.items(),
-                key=lambda x: x[1] if isinstance(x[1], (int, float)) else 0,
-                reverse=True,
-            )
             top_traits = [
                 {"name": name, "value": value}
-                for name, value in sorted_traits[:3]
+                for name, value in heapq.nlargest(
+                    3, profile.traits.items(), key=_trait_sort_key
+                )
             ]
 
         return {
@@ -556,6 +536,6 @@ class ProfileService:
             "behavioral_patterns": profile.behavioral_patterns or {},
             "context_summary": profile.context_summary,
             "profile_version": profile.profile_version,
-            "created_at": profile.created_at.isoformat() if profile.created_at else None,
-            "updated_at": profile.updated_at.isoformat() if profile.updated_at else None,
+            "created_at": _iso(profile.created_at),
+            "updated_at": _iso(profile.updated_at),
         }